@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import altair as alt
+import numpy as np
 import polars as pl
 
 from crv.viz import events as _events
@@ -30,6 +31,16 @@ def _apply_chart_defaults(ch: alt.TopLevelMixin) -> alt.TopLevelMixin:
         return ch
 
 
+def _colset(df: pl.DataFrame) -> frozenset[str]:
+    """Return df's column names as a frozenset for repeated membership checks."""
+    return frozenset(df.columns)
+
+
+def _with_t(df: pl.DataFrame) -> pl.DataFrame:
+    """Rename step->t on raw frames; loader output already has t and passes through."""
+    return df if "t" in df.columns else normalize_time_object(df)
+
+
 # ----------------------------
 # Layering helpers (no inline casting in UI)
 # ----------------------------
@@ -79,78 +90,240 @@ def overview_counts_by_t(at_df: pl.DataFrame) -> alt.TopLevelMixin:
 # ----------------------------
 
 
-def _apply_ts_sampling(
-    df: pl.DataFrame, *, max_points: int | None, stride: int | None
-) -> pl.DataFrame:
+def _ts_stride(n: int, *, max_points: int | None, stride: int | None) -> int:
+    """Return the every-k stride for sampling n rows (1 keeps every row)."""
     if stride is not None and stride > 1:
-        return (
-            df.sort("t").with_row_index(name="_rn").filter(pl.col("_rn") % stride == 0).drop("_rn")
-        )
-    if max_points is not None and max_points > 0 and df.height > max_points:
+        return stride
+    if max_points is not None and max_points > 0 and n > max_points:
         # Approx even sample by stride
-        stride = max((df.height + max_points - 1) // max_points, 1)
-        return (
-            df.sort("t").with_row_index(name="_rn").filter(pl.col("_rn") % stride == 0).drop("_rn")
-        )
-    return df
+        return (n + max_points - 1) // max_points
+    return 1
+
+
+def _sort_by_t(df: pl.DataFrame) -> pl.DataFrame:
+    """Sort by t unless already non-decreasing (O(1) when Polars' sorted flag is set)."""
+    return df if df.get_column("t").is_sorted() else df.sort("t")
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Return row indices picked by Largest-Triangle-Three-Buckets (x ascending).
+
+    Keeps the first and last points; each interior bucket contributes the point
+    forming the largest triangle with the previously kept point and the mean of
+    the next bucket, so spikes survive where a uniform stride would drop them.
+    """
+    n = x.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for k in range(n_out - 2):
+        lo, hi = edges[k], edges[k + 1]
+        if k + 2 < edges.shape[0]:
+            nxt_x, nxt_y = x[hi : edges[k + 2]].mean(), y[hi : edges[k + 2]].mean()
+        else:
+            nxt_x, nxt_y = x[n - 1], y[n - 1]
+        area = np.abs((x[a] - nxt_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (nxt_y - y[a]))
+        a = lo + int(np.argmax(area))
+        idx[k + 1] = a
+    return idx
+
+
+def _lttb_sample(df: pl.DataFrame, *, y_col: str, max_points: int, by: list[str]) -> pl.DataFrame:
+    """LTTB-downsample each series in df (split by `by`) to share a max_points budget."""
+    parts = df.partition_by(by, maintain_order=True) if by else [df]
+    n_out = max(max_points // len(parts), 3)
+    kept: list[pl.DataFrame] = []
+    for part in parts:
+        part = _sort_by_t(part)
+        x = part.get_column("t").cast(pl.Float64).to_numpy()
+        y = np.nan_to_num(part.get_column(y_col).cast(pl.Float64).to_numpy())
+        kept.append(part[_lttb_indices(x, y, n_out)])
+    return pl.concat(kept, how="vertical", rechunk=False) if kept else df
+
+
+def _apply_ts_sampling_lazy(
+    lf: pl.LazyFrame,
+    *,
+    n_rows: int,
+    max_points: int | None,
+    stride: int | None,
+    y_col: str | None = None,
+    by: list[str] | None = None,
+    source: pl.DataFrame | None = None,
+) -> pl.LazyFrame:
+    # source: the eager input; its t column is read only once a stride applies, so frames
+    # without t pass through unsampled, and checked for order so presorted data skips the sort
+    if y_col is not None and (stride is None or stride <= 1):
+        if max_points is None or max_points <= 0 or n_rows <= max_points:
+            return lf
+        mp, keys = max_points, list(by or [])
+        return lf.map_batches(lambda df: _lttb_sample(df, y_col=y_col, max_points=mp, by=keys))
+    k = _ts_stride(n_rows, max_points=max_points, stride=stride)
+    if k <= 1:
+        return lf
+    presorted = source is not None and source.get_column("t").is_sorted()
+    return (lf if presorted else lf.sort("t")).gather_every(k)
+
+
+def _apply_ts_sampling(
+    df: pl.DataFrame,
+    *,
+    max_points: int | None,
+    stride: int | None,
+    y_col: str | None = None,
+    by: list[str] | None = None,
+) -> pl.DataFrame:
+    if y_col is not None and (stride is None or stride <= 1):
+        if max_points is None or max_points <= 0 or df.height <= max_points:
+            return df
+        return _lttb_sample(df, y_col=y_col, max_points=max_points, by=list(by or []))
+    k = _ts_stride(df.height, max_points=max_points, stride=stride)
+    return _sort_by_t(df).gather_every(k) if k > 1 else df
 
 
 def apply_ts_sampling(
-    df: pl.DataFrame, *, max_points: int | None = None, stride: int | None = None
+    df: pl.DataFrame,
+    *,
+    max_points: int | None = None,
+    stride: int | None = None,
+    y_col: str | None = None,
+    by: list[str] | None = None,
 ) -> pl.DataFrame:
-    """Public wrapper for internal sampling; stable name for external callers."""
-    return _apply_ts_sampling(df, max_points=max_points, stride=stride)
+    """Public wrapper for internal sampling; stable name for external callers.
+
+    An explicit stride always keeps every k-th row by t. With only max_points,
+    passing y_col switches from a uniform stride to LTTB per series (split by
+    `by`), which preserves peaks; use it for already-aggregated series only.
+    """
+    return _apply_ts_sampling(df, max_points=max_points, stride=stride, y_col=y_col, by=by)
 
 
-def ts_endowment_chart(
+def ts_sampling_plan(
+    df: pl.DataFrame,
+    *,
+    max_points: int | None = None,
+    stride: int | None = None,
+    y_col: str | None = None,
+    by: list[str] | None = None,
+) -> pl.LazyFrame:
+    """Lazy counterpart of apply_ts_sampling, for batching several frames via pl.collect_all."""
+    return _apply_ts_sampling_lazy(
+        df.lazy(),
+        n_rows=df.height,
+        max_points=max_points,
+        stride=stride,
+        y_col=y_col,
+        by=by,
+        source=df,
+    )
+
+
+def _ts_plan(
+    at_df: pl.DataFrame, need: set[str], *, ts_max_points: int | None, ts_stride: int | None
+) -> pl.LazyFrame:
+    lf = at_df.lazy().select([c for c in at_df.columns if c in need])
+    return _apply_ts_sampling_lazy(
+        lf,
+        n_rows=at_df.height,
+        max_points=ts_max_points,
+        stride=ts_stride,
+        source=at_df,
+    )
+
+
+def ts_endowment_plan(
     at_df: pl.DataFrame,
     *,
     group_field: str | None,
     by_object_if_no_group: bool = True,
     ts_max_points: int | None = None,
     ts_stride: int | None = None,
-) -> alt.TopLevelMixin:
-    """Band+line endowment. Sampling applied to raw rows before aggregation."""
+) -> pl.LazyFrame:
+    """Sampled rows behind ts_endowment_chart, as an uncollected LazyFrame."""
     need = {"t", "s_io"}
     if group_field:
         need.add(group_field)
     if by_object_if_no_group:
         need.add("o")
-    df = at_df.select([c for c in at_df.columns if c in need]).clone()
-    df = _apply_ts_sampling(df, max_points=ts_max_points, stride=ts_stride)
+    return _ts_plan(at_df, need, ts_max_points=ts_max_points, ts_stride=ts_stride)
+
+
+def ts_endowment_chart(
+    at_df: pl.DataFrame,
+    *,
+    group_field: str | None,
+    by_object_if_no_group: bool = True,
+    ts_max_points: int | None = None,
+    ts_stride: int | None = None,
+) -> alt.TopLevelMixin:
+    """Band+line endowment. Sampling applied to raw rows before aggregation."""
+    df = ts_endowment_plan(
+        at_df,
+        group_field=group_field,
+        by_object_if_no_group=by_object_if_no_group,
+        ts_max_points=ts_max_points,
+        ts_stride=ts_stride,
+    ).collect(engine="streaming")
     return _apply_chart_defaults(
         plot_endowment(df, group=group_field, by_object=by_object_if_no_group)
     )
 
 
-def ts_valuation_chart(
+def ts_valuation_plan(
     at_df: pl.DataFrame,
     *,
-    cost: float | None,
     group_field: str | None,
     ts_max_points: int | None = None,
     ts_stride: int | None = None,
-) -> alt.TopLevelMixin:
+) -> pl.LazyFrame:
+    """Sampled rows behind ts_valuation_chart, as an uncollected LazyFrame."""
     need = {"t", "value_score"}
     if group_field:
         need.add(group_field)
-    df = at_df.select([c for c in at_df.columns if c in need]).clone()
-    df = _apply_ts_sampling(df, max_points=ts_max_points, stride=ts_stride)
-    return _apply_chart_defaults(plot_valuation(df, cost=cost, group=group_field))
+    return _ts_plan(at_df, need, ts_max_points=ts_max_points, ts_stride=ts_stride)
 
 
-def ts_holdings_rate_chart(
+def ts_valuation_chart(
     at_df: pl.DataFrame,
     *,
+    cost: float | None,
     group_field: str | None,
     ts_max_points: int | None = None,
     ts_stride: int | None = None,
 ) -> alt.TopLevelMixin:
+    df = ts_valuation_plan(
+        at_df, group_field=group_field, ts_max_points=ts_max_points, ts_stride=ts_stride
+    ).collect(engine="streaming")
+    return _apply_chart_defaults(plot_valuation(df, cost=cost, group=group_field))
+
+
+def ts_holdings_rate_plan(
+    at_df: pl.DataFrame,
+    *,
+    group_field: str | None,
+    ts_max_points: int | None = None,
+    ts_stride: int | None = None,
+) -> pl.LazyFrame:
+    """Sampled rows behind ts_holdings_rate_chart, as an uncollected LazyFrame."""
     need = {"t", "y_io"}
     if group_field:
         need.add(group_field)
-    df = at_df.select([c for c in at_df.columns if c in need]).clone()
-    df = _apply_ts_sampling(df, max_points=ts_max_points, stride=ts_stride)
+    return _ts_plan(at_df, need, ts_max_points=ts_max_points, ts_stride=ts_stride)
+
+
+def ts_holdings_rate_chart(
+    at_df: pl.DataFrame,
+    *,
+    group_field: str | None,
+    ts_max_points: int | None = None,
+    ts_stride: int | None = None,
+) -> alt.TopLevelMixin:
+    df = ts_holdings_rate_plan(
+        at_df, group_field=group_field, ts_max_points=ts_max_points, ts_stride=ts_stride
+    ).collect(engine="streaming")
     return _apply_chart_defaults(plot_holdings_rate(df, group=group_field))
 
 
@@ -198,44 +371,43 @@ def network_snapshot_chart(
     network_max_edges: int | None = None,
 ) -> alt.TopLevelMixin:
     """Build network snapshot using relations at a given time."""
-    rel_df = normalize_time_object(rel_df)
+    rel_df = _with_t(rel_df)
     validate_schema(rel_df, {"t": pl.Int64, "i": pl.Int64, "j": pl.Int64})
     if "a_ij" not in rel_df.columns:
         raise ValueError("relations must include a_ij")
 
-    # Filter at t_sel
-    r = rel_df.filter(pl.col("t") == t_sel)
-    if r.height == 0:
-        # Empty placeholder
-        return _apply_chart_defaults(
-            alt.Chart(alt.Data(values=[]))
-            .mark_text()
-            .encode(text=alt.value(f"No edges at t={t_sel}"))
-        )
-
-    # Threshold or top-K by |a_ij|
-    r = r.with_columns([pl.col("a_ij").abs().alias("weight")])
+    # Filter at t_sel, then threshold or top-K by |a_ij| in one plan
     if edge_threshold is not None:
-        r = r.filter(pl.col("weight") >= float(edge_threshold))
+        keep = pl.col("weight") >= float(edge_threshold)
     else:
         # No threshold provided: drop zero-weight links so we don't draw a fully connected graph
-        r = r.filter(pl.col("weight") > 0)
-    if network_max_edges is not None and r.height > network_max_edges:
-        r = r.sort("weight", descending=True).head(network_max_edges)
+        keep = pl.col("weight") > 0
+    rlf = (
+        rel_df.lazy()
+        .filter(pl.col("t") == t_sel)
+        .select(
+            pl.col("i").alias("src"), pl.col("j").alias("dst"), pl.col("a_ij").abs().alias("weight")
+        )
+        .filter(keep)
+    )
+    if network_max_edges is not None:
+        rlf = rlf.top_k(network_max_edges, by="weight")
+    r = rlf.collect(engine="streaming")
     # If after filtering there are no edges, return a placeholder rather than drawing zero-weight edges
     if r.height == 0:
+        at_t_empty = not rel_df.get_column("t").eq(t_sel).any()
+        msg = f"No edges at t={t_sel}" if at_t_empty else f"No edges at t={t_sel} (post-filter)"
         return _apply_chart_defaults(
-            alt.Chart(alt.Data(values=[]))
-            .mark_text()
-            .encode(text=alt.value(f"No edges at t={t_sel} (post-filter)"))
+            alt.Chart(alt.Data(values=[])).mark_text().encode(text=alt.value(msg))
         )
 
-    node_ids = sorted(set(r["i"].to_list()) | set(r["j"].to_list()))
-    layout = compute_circular_layout(node_ids)
+    endpoints = pl.concat([r.get_column("src"), r.get_column("dst")], rechunk=False)
+    node_ids = endpoints.unique().sort()
+    layout = compute_circular_layout(node_ids.to_list())
 
     # Optional group coloring from at_df at this t
     nodes = layout
-    if at_df is not None and {"agent_id", "group", "t"}.issubset(set(at_df.columns)):
+    if at_df is not None and _colset(at_df).issuperset(("agent_id", "group", "t")):
         gmap = (
             at_df.filter(pl.col("t") == t_sel)
             .select(["agent_id", "group"])
@@ -248,13 +420,14 @@ def network_snapshot_chart(
     if "group" not in nodes.columns:
         nodes = nodes.with_columns(pl.lit("all").alias("group"))
 
-    # Preserve src/dst before joins so optimizer doesn't drop them
-    r2 = r.with_columns([pl.col("i").alias("src"), pl.col("j").alias("dst")])
-
+    # Endpoints are already named src/dst, so both layout joins keep their keys
+    layout_lf = layout.lazy()
     edges = (
-        r2.join(layout.rename({"i": "src", "x": "x1", "y": "y1"}), left_on="i", right_on="src")
-        .join(layout.rename({"i": "dst", "x": "x2", "y": "y2"}), left_on="j", right_on="dst")
+        r.lazy()
+        .join(layout_lf.rename({"i": "src", "x": "x1", "y": "y1"}), on="src")
+        .join(layout_lf.rename({"i": "dst", "x": "x2", "y": "y2"}), on="dst")
         .select(["src", "dst", "x1", "y1", "x2", "y2", "weight"])
+        .collect(engine="streaming")
     )
     return _apply_chart_defaults(
         plot_network(nodes, edges, node_color="group", node_size=None, edge_weight="weight")
@@ -295,6 +468,29 @@ def triads_chart(
 # ----------------------------
 
 
+def cee_plan(
+    cee_df: pl.DataFrame,
+    *,
+    cee_max_points: int | None = None,
+    cee_stride: int | None = None,
+    object_col: str = "o",
+) -> pl.LazyFrame:
+    """Per-object stride/cap of cee_df as an uncollected LazyFrame."""
+    lf = cee_df.lazy()
+    # Apply stride per object to keep points bounded (one windowed pass over all objects)
+    stride_o: pl.Expr | int | None = None
+    if cee_stride is not None and cee_stride > 1:
+        stride_o = cee_stride
+    elif cee_max_points is not None and cee_max_points > 0:
+        # Approx cap per object
+        stride_o = (pl.len() + cee_max_points - 1).over(object_col) // cee_max_points
+    if stride_o is None:
+        return lf
+    return lf.sort([object_col, "t"]).filter(
+        pl.int_range(pl.len()).over(object_col) % stride_o == 0
+    )
+
+
 def cee_small_multiples_chart(
     cee_df: pl.DataFrame,
     *,
@@ -305,39 +501,12 @@ def cee_small_multiples_chart(
 ) -> alt.TopLevelMixin:
     """Stride/cap per object, then delegate to plot_cee_small_multiples."""
     # Validate minimally (plot_cee_small_multiples will perform strict checks)
-    if not {"t", object_col, group_col, "cee"}.issubset(set(cee_df.columns)):
+    if not _colset(cee_df).issuperset(("t", object_col, group_col, "cee")):
         raise ValueError("cee_df missing required columns")
 
-    df = cee_df
-    # Apply stride per object to keep points bounded
-    if cee_stride is not None and cee_stride > 1:
-        parts: list[pl.DataFrame] = []
-        for _, g in df.group_by(object_col, maintain_order=True):
-            g2 = (
-                g.sort("t")
-                .with_row_index(name="_rn")
-                .filter(pl.col("_rn") % cee_stride == 0)
-                .drop("_rn")
-            )
-            parts.append(g2)
-        df = pl.concat(parts, how="vertical") if parts else df
-    elif cee_max_points is not None and cee_max_points > 0:
-        # Approx cap per object
-        out_parts: list[pl.DataFrame] = []
-        for o, g in df.group_by(object_col, maintain_order=True):
-            n = g.height
-            if n <= cee_max_points:
-                out_parts.append(g)
-            else:
-                stride = max((n + cee_max_points - 1) // cee_max_points, 1)
-                out_parts.append(
-                    g.sort("t")
-                    .with_row_index(name="_rn")
-                    .filter(pl.col("_rn") % stride == 0)
-                    .drop("_rn")
-                )
-        df = pl.concat(out_parts, how="vertical")
-
+    df = cee_plan(
+        cee_df, cee_max_points=cee_max_points, cee_stride=cee_stride, object_col=object_col
+    ).collect(engine="streaming")
     return _apply_chart_defaults(
         plot_cee_small_multiples(df, object_col=object_col, group_col=group_col)
     )
@@ -376,6 +545,12 @@ def identity_representation_chart(
     )
 
 
+def _semi_join_on(lf: pl.LazyFrame, keys: pl.LazyFrame, col: str, key_col: str) -> pl.LazyFrame:
+    """Keep rows of lf whose col value appears in keys[key_col] (cast to lf's dtype)."""
+    dtype = lf.collect_schema()[col]
+    return lf.join(keys.select(pl.col(key_col).cast(dtype).alias(col)), on=col, how="semi")
+
+
 def extract_identity_representation(
     *,
     at_df: pl.DataFrame,
@@ -397,82 +572,75 @@ def extract_identity_representation(
     """
     # Slice agent-token data
     need_at = {"t", "o", "s_io", "agent_id"}
-    has_rp = "rp" in at_df.columns
-    has_rn = "rn" in at_df.columns
+    at_cols = _colset(at_df)
+    has_rp = "rp" in at_cols
+    has_rn = "rn" in at_cols
     if has_rp:
         need_at.add("rp")
     if has_rn:
         need_at.add("rn")
-    if not need_at.issubset(set(at_df.columns)):
+    if not at_cols.issuperset(need_at):
         return {"objects": [], "others": [], "b_ijo": []}
 
     at_t = (
-        at_df.filter((pl.col("t") == t_sel) & (pl.col("agent_id") == agent_sel))
+        at_df.lazy()
+        .filter((pl.col("t") == t_sel) & (pl.col("agent_id") == agent_sel))
         .select([c for c in at_df.columns if c in need_at])
         .unique(keep="last")
     )
-    objs = at_t.with_columns(pl.col("s_io").abs().alias("_abs")).sort("_abs", descending=True)
-    objs = objs.head(top_o).drop("_abs")
-    objs = objs.with_columns(
-        [
-            (pl.col("rp") if has_rp else pl.lit(0.0)).alias("rp"),
-            (pl.col("rn") if has_rn else pl.lit(0.0)).alias("rn"),
-        ]
-    ).select(["o", "s_io", "rp", "rn"])
+    objs_lf = (
+        at_t.top_k(top_o, by=pl.col("s_io").abs())
+        # top_k does not guarantee output order; keep the displayed |s_io| ranking
+        .sort(pl.col("s_io").abs(), descending=True)
+        .with_columns(
+            [
+                (pl.col("rp") if has_rp else pl.lit(0.0)).alias("rp"),
+                (pl.col("rn") if has_rn else pl.lit(0.0)).alias("rn"),
+            ]
+        )
+        .select(["o", "s_io", "rp", "rn"])
+        .cache()
+    )
+
+    # Loaders already normalize step->t; raw frames keyed on step are renamed here
+    rel_df = _with_t(rel_df) if rel_df is not None else None
+    other_df = _with_t(other_df) if other_df is not None else None
+    oo_df = _with_t(oo_df) if oo_df is not None else None
+
+    # Self-centred slices of every relation table share this predicate
+    at_agent_t = (pl.col("t") == t_sel) & (pl.col("i") == agent_sel)
 
     # Slice self->other
-    if rel_df is not None and {"t", "i", "j", "a_ij"}.issubset(set(rel_df.columns)):
-        rdf = normalize_time_object(rel_df).filter(
-            (pl.col("t") == t_sel) & (pl.col("i") == agent_sel)
-        )
-        others = (
-            rdf.with_columns(pl.col("a_ij").abs().alias("_abs"))
-            .sort("_abs", descending=True)
-            .head(top_j)
-            .drop("_abs")
+    if rel_df is not None and _colset(rel_df).issuperset(("t", "i", "j", "a_ij")):
+        others_lf = (
+            rel_df.lazy()
+            .filter(at_agent_t)
+            .top_k(top_j, by=pl.col("a_ij").abs())
+            .sort(pl.col("a_ij").abs(), descending=True)
             .select(["j", "a_ij"])
+            .cache()
         )
     else:
-        others = pl.DataFrame(
-            {"j": pl.Series([], dtype=pl.Int64), "a_ij": pl.Series([], dtype=pl.Float64)}
-        )
+        others_lf = pl.LazyFrame(schema={"j": pl.Int64, "a_ij": pl.Float64})
 
-    # Slice other->object restricted to selected sets
-    if other_df is not None and {"t", "i", "j", "o", "b_ijo"}.issubset(set(other_df.columns)):
-        b = normalize_time_object(other_df).filter(
-            (pl.col("t") == t_sel) & (pl.col("i") == agent_sel)
-        )
-        sels_o = set(objs["o"].to_list())
-        sels_j = set(others["j"].to_list())
-        b = b.filter(pl.col("o").is_in(list(sels_o)) & pl.col("j").is_in(list(sels_j))).select(
-            ["j", "o", "b_ijo"]
-        )
+    # Slice other->object restricted to selected sets (semi-joins keep it one lazy plan)
+    if other_df is not None and _colset(other_df).issuperset(("t", "i", "j", "o", "b_ijo")):
+        b_lf = other_df.lazy().filter(at_agent_t).select(["j", "o", "b_ijo"])
+        b_lf = _semi_join_on(b_lf, objs_lf, "o", "o")
+        b_lf = _semi_join_on(b_lf, others_lf, "j", "j")
     else:
-        b = pl.DataFrame(
-            {
-                "j": pl.Series([], dtype=pl.Int64),
-                "o": pl.Series([], dtype=pl.Int64),
-                "b_ijo": pl.Series([], dtype=pl.Float64),
-            }
-        )
+        b_lf = pl.LazyFrame(schema={"j": pl.Int64, "o": pl.Int64, "b_ijo": pl.Float64})
 
     # Slice object<->object among selected objects
-    if oo_df is not None and {"t", "i", "o", "op", "r_oo"}.issubset(set(oo_df.columns)):
-        oo = normalize_time_object(oo_df).filter(
-            (pl.col("t") == t_sel) & (pl.col("i") == agent_sel)
-        )
-        sels_o = set(objs["o"].to_list())
-        oo = oo.filter(pl.col("o").is_in(list(sels_o)) & pl.col("op").is_in(list(sels_o))).select(
-            ["o", "op", "r_oo"]
-        )
+    if oo_df is not None and _colset(oo_df).issuperset(("t", "i", "o", "op", "r_oo")):
+        oo_lf = oo_df.lazy().filter(at_agent_t).select(["o", "op", "r_oo"])
+        oo_lf = _semi_join_on(oo_lf, objs_lf, "o", "o")
+        oo_lf = _semi_join_on(oo_lf, objs_lf, "op", "o")
     else:
-        oo = pl.DataFrame(
-            {
-                "o": pl.Series([], dtype=pl.Int64),
-                "op": pl.Series([], dtype=pl.Int64),
-                "r_oo": pl.Series([], dtype=pl.Float64),
-            }
-        )
+        oo_lf = pl.LazyFrame(schema={"o": pl.Int64, "op": pl.Int64, "r_oo": pl.Float64})
+
+    # Dispatch all four slices together; the cached objs/others subplans run once
+    objs, others, b, oo = pl.collect_all([objs_lf, others_lf, b_lf, oo_lf])
 
     return {
         "objects": to_values(objs),
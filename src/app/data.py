@@ -12,11 +12,16 @@ from crv.viz.base import normalize_time_object, scan_parquet_columns
 
 __all__ = [
     "CacheConfig",
+    "FileStamp",
+    "run_file_stamp",
     "load_agents_tokens",
     "load_relations",
+    "load_relations_at_t",
     "load_other_object",
     "load_object_object",
+    "load_relation_tables",
     "load_events",
+    "load_cee",
     "load_model_specs",
     "get_time_bounds",
     "even_sample",
@@ -58,14 +63,78 @@ def _get_cached(loader_name: str, cfg: CacheConfig, fn: Callable[..., Any]) -> C
 
 # ---------- Internal IO helpers (Polars-first, projection pushdown) ----------
 
+FileStamp = tuple[int, int] | None
+
+
+def _file_stamp(path: Path) -> FileStamp:
+    """Return (st_mtime_ns, st_size) for path, or None when it does not exist.
+
+    Passed to the cached loaders as an extra argument so Streamlit keys cached
+    frames on file contents, not only on run_dir: a rewritten parquet invalidates
+    its entry immediately instead of waiting for the TTL. The loaders also treat a
+    None stamp as "file missing", so each load costs a single stat.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def run_file_stamp(run_dir: str, filename: str) -> FileStamp:
+    """Return the (st_mtime_ns, st_size) stamp of a run file, or None if missing."""
+    return _file_stamp(Path(run_dir) / filename)
+
+
+# Canonical columns each loader must produce after normalization
+_RELATIONS_COLS = ("t", "i", "j", "a_ij")
+_OTHER_OBJECT_COLS = ("t", "i", "j", "o", "b_ijo")
+_OBJECT_OBJECT_COLS = ("t", "i", "o", "op", "r_oo")
+_EVENTS_COLS = ("t", "type")
+
+
+def _has_columns(df: pl.DataFrame, need: tuple[str, ...]) -> bool:
+    cols = df.columns
+    return all(c in cols for c in need)
+
+
+def _mark_sorted_t(df: pl.DataFrame) -> pl.DataFrame:
+    """Set Polars' sorted flag on t when rows are already in t order.
+
+    Parquet round-trips drop the flag. Restoring it once at load time (the frame is
+    then cached) makes later is_sorted()/min/max on t O(1) and lets t filters and
+    group-bys take Polars' sorted fast paths.
+    """
+    if "t" in df.columns and df.get_column("t").is_sorted():
+        return df.with_columns(pl.col("t").set_sorted())
+    return df
+
+
+def _scan_normalized(path: Path, cols: list[str], need: tuple[str, ...]) -> pl.LazyFrame | None:
+    """Lazily project cols from path, renaming step->t and token_id->o.
+
+    Returns None when the canonical columns in need are not all available.
+    """
+    lf = pl.scan_parquet(path)
+    names = lf.collect_schema().names()
+    present = [c for c in cols if c in names]
+    renames: dict[str, str] = {}
+    if "t" not in present and "step" in present:
+        renames["step"] = "t"
+    if "o" not in present and "token_id" in present:
+        renames["token_id"] = "o"
+    if not set(need).issubset(renames.get(c, c) for c in present):
+        return None
+    return lf.select(present).rename(renames)
+
 
 # ---------- Loaders (internal implementations) ----------
 
 
-def _load_agents_tokens_impl(run_dir: str) -> pl.DataFrame:
+def _load_agents_tokens_impl(run_dir: str, stamp: FileStamp) -> pl.DataFrame:
     run = Path(run_dir)
     path = run / "agents_tokens.parquet"
-    if not path.exists():
+    if stamp is None:
         raise FileNotFoundError(f"Required file not found: {path}")
     # Support Mesa v3+ alternates; normalize -> 't','o'
     cols = [
@@ -85,58 +154,116 @@ def _load_agents_tokens_impl(run_dir: str) -> pl.DataFrame:
     ]
     df = scan_parquet_columns(str(path), cols)
     df = normalize_time_object(df)
-    return df
+    # Dictionary-encode group labels once: unique() then walks the small vocab
+    # and every tab reuses the compact column
+    if df.schema.get("group") == pl.String:
+        df = df.with_columns(pl.col("group").cast(pl.Categorical))
+    return _mark_sorted_t(df)
 
 
-def _load_relations_impl(run_dir: str) -> pl.DataFrame | None:
+def _load_relations_impl(run_dir: str, stamp: FileStamp) -> pl.DataFrame | None:
     run = Path(run_dir)
     path = run / "relations.parquet"
-    if not path.exists():
+    if stamp is None:
         return None
     df = scan_parquet_columns(str(path), ["step", "i", "j", "a_ij"])
     df = normalize_time_object(df)
     # Ensure canonical columns present
-    need = {"t", "i", "j", "a_ij"}
-    if not need.issubset(set(df.columns)):
+    if not _has_columns(df, _RELATIONS_COLS):
         return None
-    return df
+    return _mark_sorted_t(df)
+
+
+def _load_relations_at_t_impl(run_dir: str, t_sel: int, stamp: FileStamp) -> pl.DataFrame | None:
+    """Load relations at a single t; the t predicate is pushed into the parquet scan.
+
+    Parquet row-group statistics let the reader skip row groups whose step range
+    excludes t_sel, so a snapshot reads roughly 1/T of the table.
+    """
+    run = Path(run_dir)
+    path = run / "relations.parquet"
+    if stamp is None:
+        return None
+    lf = pl.scan_parquet(path, use_statistics=True)
+    names = lf.collect_schema().names()
+    t_col = "t" if "t" in names else "step"
+    if not {t_col, "i", "j", "a_ij"}.issubset(names):
+        return None
+    return (
+        lf.filter(pl.col(t_col) == t_sel)
+        .select(pl.col(t_col).alias("t"), "i", "j", "a_ij")
+        .collect()
+    )
 
 
-def _load_other_object_impl(run_dir: str) -> pl.DataFrame | None:
+def _load_other_object_impl(run_dir: str, stamp: FileStamp) -> pl.DataFrame | None:
     run = Path(run_dir)
     path = run / "other_object.parquet"
-    if not path.exists():
+    if stamp is None:
         return None
     df = scan_parquet_columns(str(path), ["step", "i", "j", "o", "b_ijo"])
     df = normalize_time_object(df)
-    need = {"t", "i", "j", "o", "b_ijo"}
-    if not need.issubset(set(df.columns)):
+    if not _has_columns(df, _OTHER_OBJECT_COLS):
         return None
-    return df
+    return _mark_sorted_t(df)
 
 
-def _load_object_object_impl(run_dir: str) -> pl.DataFrame | None:
+def _load_object_object_impl(run_dir: str, stamp: FileStamp) -> pl.DataFrame | None:
     """Load object<->object structure (r_oo) if present; normalize step->t."""
     run = Path(run_dir)
     path = run / "object_object.parquet"
-    if not path.exists():
+    if stamp is None:
         return None
     df = scan_parquet_columns(str(path), ["step", "i", "o", "op", "r_oo"])
     df = normalize_time_object(df)
-    need = {"t", "i", "o", "op", "r_oo"}
-    if not need.issubset(set(df.columns)):
+    if not _has_columns(df, _OBJECT_OBJECT_COLS):
         return None
-    return df
+    return _mark_sorted_t(df)
+
 
+def _load_relation_tables_impl(
+    run_dir: str,
+    t_sel: int | None,
+    agent: int | None,
+    stamp: tuple[FileStamp, FileStamp, FileStamp],
+) -> tuple[pl.DataFrame | None, pl.DataFrame | None, pl.DataFrame | None]:
+    """Load relations, other_object and object_object with a single collect_all.
 
-def _load_events_impl(run_dir: str) -> pl.DataFrame | None:
+    The three scans are independent, so collecting them together lets Polars read
+    the files in parallel instead of paying three sequential open/collect rounds.
+    Optional t_sel/agent predicates are pushed into each scan, so row groups whose
+    statistics exclude them are skipped.
+    """
+    run = Path(run_dir)
+    specs = (
+        ("relations.parquet", ["step", "i", "j", "a_ij"], _RELATIONS_COLS),
+        ("other_object.parquet", ["step", "i", "j", "o", "b_ijo"], _OTHER_OBJECT_COLS),
+        ("object_object.parquet", ["step", "i", "o", "op", "r_oo"], _OBJECT_OBJECT_COLS),
+    )
+    plans = [
+        _scan_normalized(run / name, cols, need) if file_stamp is not None else None
+        for (name, cols, need), file_stamp in zip(specs, stamp, strict=True)
+    ]
+    predicates: list[pl.Expr] = []
+    if t_sel is not None:
+        predicates.append(pl.col("t") == t_sel)
+    if agent is not None:
+        predicates.append(pl.col("i") == agent)
+    if predicates:
+        plans = [lf.filter(*predicates) if lf is not None else None for lf in plans]
+    frames = iter(pl.collect_all([lf for lf in plans if lf is not None]))
+    rel, other, oo = (_mark_sorted_t(next(frames)) if lf is not None else None for lf in plans)
+    return rel, other, oo
+
+
+def _load_events_impl(run_dir: str, stamp: FileStamp) -> pl.DataFrame | None:
     """Load events timeline if present; normalize step->t and pass through known fields.
 
     Expected columns (subset): step|t, type, i, j, o, op, val, mode
     """
     run = Path(run_dir)
     path = run / "events.parquet"
-    if not path.exists():
+    if stamp is None:
         return None
     desired = [
         "step",
@@ -163,8 +290,7 @@ def _load_events_impl(run_dir: str) -> pl.DataFrame | None:
     df = scan_parquet_columns(str(path), desired)
     df = normalize_time_object(df)
     # Require at least t and type to be present
-    need = {"t", "type"}
-    if not need.issubset(set(df.columns)):
+    if not _has_columns(df, _EVENTS_COLS):
         return None
     # Coerce type to string if necessary
     casts: list[pl.Expr] = []
@@ -173,24 +299,61 @@ def _load_events_impl(run_dir: str) -> pl.DataFrame | None:
             casts.append(pl.col(column).cast(pl.Utf8))
     if casts:
         df = df.with_columns(casts)
-    return df
+    return _mark_sorted_t(df)
+
+
+def _load_cee_impl(
+    run_dir: str,
+    t_range: tuple[int, int] | None,
+    groups: tuple[str, ...] | None,
+    stamp: FileStamp,
+) -> pl.DataFrame | None:
+    """Load CEE rows with the t window and group filter pushed into the parquet scan.
 
+    Filtering before collect lets the reader prune columns and skip row groups whose
+    statistics fall outside the window, instead of reading the whole file first.
 
-def _load_model_specs_impl(run_dir: str) -> list[dict[str, str]]:
+    Raises:
+        ValueError: If cee.parquet exists but lacks the t, o/token_id or cee columns.
+    """
+    run = Path(run_dir)
+    path = run / "cee.parquet"
+    if stamp is None:
+        return None
+    lf = pl.scan_parquet(path, use_statistics=True)
+    names = lf.collect_schema().names()
+    o_col = "o" if "o" in names else "token_id"
+    missing = [c for c in ("t", o_col, "cee") if c not in names]
+    if missing:
+        raise ValueError(f"cee.parquet is missing required columns: {missing}")
+    if t_range is not None:
+        lf = lf.filter(pl.col("t").is_between(t_range[0], t_range[1]))
+    if groups is not None and "group" in names:
+        lf = lf.filter(pl.col("group").is_in(list(groups)))
+    select: list[str | pl.Expr] = ["t", pl.col(o_col).alias("o")]
+    if "group" in names:
+        select.append("group")
+    select.append("cee")
+    return _mark_sorted_t(lf.select(select).collect())
+
+
+def _load_model_specs_impl(
+    run_dir: str, stamp: tuple[FileStamp, FileStamp]
+) -> list[dict[str, str]]:
     run = Path(run_dir)
     model_path = run / "model.parquet"
     meta_path = run / "metadata.json"
     specs: dict[str, str] = {}
 
     try:
-        if model_path.exists():
+        if stamp[0] is not None:
             mdf = pl.read_parquet(model_path)
             if mdf.height > 0:
                 row = mdf.row(0, named=True)
                 for key in ["seed", "n_agents", "n_tokens", "k", "steps"]:
                     if key in row and row[key] is not None:
                         specs[key] = str(row[key])
-        if meta_path.exists():
+        if stamp[1] is not None:
             meta = pl.read_json(str(meta_path)).to_dicts()
             if meta:
                 for key in ["agent_params", "model_params", "experiment_params"]:
@@ -209,34 +372,89 @@ def _load_model_specs_impl(run_dir: str) -> list[dict[str, str]]:
 
 def load_agents_tokens(run_dir: str, *, cfg: CacheConfig = CacheConfig()) -> pl.DataFrame:
     fn = _get_cached("load_agents_tokens", cfg, _load_agents_tokens_impl)
-    return fn(run_dir)  # type: ignore[no-any-return]
+    stamp = _file_stamp(Path(run_dir) / "agents_tokens.parquet")
+    return fn(run_dir, stamp)  # type: ignore[no-any-return]
 
 
 def load_relations(run_dir: str, *, cfg: CacheConfig = CacheConfig()) -> pl.DataFrame | None:
     fn = _get_cached("load_relations", cfg, _load_relations_impl)
-    return fn(run_dir)  # type: ignore[no-any-return]
+    stamp = _file_stamp(Path(run_dir) / "relations.parquet")
+    return fn(run_dir, stamp)  # type: ignore[no-any-return]
+
+
+def load_relations_at_t(
+    run_dir: str, t_sel: int, *, cfg: CacheConfig = CacheConfig()
+) -> pl.DataFrame | None:
+    """Return relations rows at t_sel only, or None if missing."""
+    fn = _get_cached("load_relations_at_t", cfg, _load_relations_at_t_impl)
+    stamp = _file_stamp(Path(run_dir) / "relations.parquet")
+    return fn(run_dir, t_sel, stamp)  # type: ignore[no-any-return]
 
 
 def load_other_object(run_dir: str, *, cfg: CacheConfig = CacheConfig()) -> pl.DataFrame | None:
     fn = _get_cached("load_other_object", cfg, _load_other_object_impl)
-    return fn(run_dir)  # type: ignore[no-any-return]
+    stamp = _file_stamp(Path(run_dir) / "other_object.parquet")
+    return fn(run_dir, stamp)  # type: ignore[no-any-return]
 
 
 def load_object_object(run_dir: str, *, cfg: CacheConfig = CacheConfig()) -> pl.DataFrame | None:
     """Return object_object (r_oo) long table or None if missing."""
     fn = _get_cached("load_object_object", cfg, _load_object_object_impl)
-    return fn(run_dir)  # type: ignore[no-any-return]
+    stamp = _file_stamp(Path(run_dir) / "object_object.parquet")
+    return fn(run_dir, stamp)  # type: ignore[no-any-return]
+
+
+def load_relation_tables(
+    run_dir: str,
+    *,
+    t_sel: int | None = None,
+    agent: int | None = None,
+    cfg: CacheConfig = CacheConfig(),
+) -> tuple[pl.DataFrame | None, pl.DataFrame | None, pl.DataFrame | None]:
+    """Return (relations, other_object, object_object), each None if missing.
+
+    When given, t_sel and agent restrict every table to rows with t == t_sel and
+    i == agent at scan time.
+    """
+    fn = _get_cached("load_relation_tables", cfg, _load_relation_tables_impl)
+    run = Path(run_dir)
+    stamp = (
+        _file_stamp(run / "relations.parquet"),
+        _file_stamp(run / "other_object.parquet"),
+        _file_stamp(run / "object_object.parquet"),
+    )
+    return fn(run_dir, t_sel, agent, stamp)  # type: ignore[no-any-return]
 
 
 def load_events(run_dir: str, *, cfg: CacheConfig = CacheConfig()) -> pl.DataFrame | None:
     """Return events long table or None if missing."""
     fn = _get_cached("load_events", cfg, _load_events_impl)
-    return fn(run_dir)  # type: ignore[no-any-return]
+    stamp = _file_stamp(Path(run_dir) / "events.parquet")
+    return fn(run_dir, stamp)  # type: ignore[no-any-return]
+
+
+def load_cee(
+    run_dir: str,
+    *,
+    t_range: tuple[int, int] | None = None,
+    groups: tuple[str, ...] | None = None,
+    cfg: CacheConfig = CacheConfig(),
+) -> pl.DataFrame | None:
+    """Return CEE rows (t, o, [group], cee) within t_range/groups, or None if missing.
+
+    Raises:
+        ValueError: If cee.parquet exists but lacks the required columns.
+    """
+    fn = _get_cached("load_cee", cfg, _load_cee_impl)
+    stamp = _file_stamp(Path(run_dir) / "cee.parquet")
+    return fn(run_dir, t_range, groups, stamp)  # type: ignore[no-any-return]
 
 
 def load_model_specs(run_dir: str, *, cfg: CacheConfig = CacheConfig()) -> list[dict[str, str]]:
     fn = _get_cached("load_model_specs", cfg, _load_model_specs_impl)
-    return fn(run_dir)  # type: ignore[no-any-return]
+    run = Path(run_dir)
+    stamp = (_file_stamp(run / "model.parquet"), _file_stamp(run / "metadata.json"))
+    return fn(run_dir, stamp)  # type: ignore[no-any-return]
 
 
 # ---------- Time bounds ----------
@@ -247,10 +465,9 @@ def get_time_bounds(df_at: pl.DataFrame) -> tuple[int, int]:
         raise ValueError("get_time_bounds requires a 't' column")
     if df_at.height == 0:
         return (0, 0)
-    # Compute scalar min/max via aggregation and extract the first row
-    agg = df_at.select(pl.col("t").min().alias("t_min"), pl.col("t").max().alias("t_max"))
-    t_min_val, t_max_val = agg.row(0)
-    return (int(t_min_val), int(t_max_val))
+    # Series-level min/max skip the intermediate frame and are O(1) when t carries a sorted flag
+    t = df_at.get_column("t")
+    return (int(t.min()), int(t.max()))  # type: ignore[arg-type]
 
 
 # ---------- Downsampling helpers (Polars-first) ----------
@@ -269,21 +486,14 @@ def even_sample(df: pl.DataFrame, max_points: int) -> pl.DataFrame:
     if n <= max_points:
         return df
 
-    if "t" in df.columns:
-        df2 = df.sort("t")
-    else:
-        df2 = df.clone()
-
+    df2 = df.sort("t") if "t" in df.columns and not df.get_column("t").is_sorted() else df
     stride = max((n + max_points - 1) // max_points, 1)
-    return df2.with_row_index(name="_rn").filter(pl.col("_rn") % stride == 0).drop("_rn")
+    return df2.gather_every(stride)
 
 
 def stride_sample(df: pl.DataFrame, stride: int) -> pl.DataFrame:
     """Keep every k-th row by time order (or original order if t missing)."""
     if stride <= 1:
         return df
-    if "t" in df.columns:
-        df2 = df.sort("t")
-    else:
-        df2 = df.clone()
-    return df2.with_row_index(name="_rn").filter(pl.col("_rn") % stride == 0).drop("_rn")
+    df2 = df.sort("t") if "t" in df.columns and not df.get_column("t").is_sorted() else df
+    return df2.gather_every(stride)
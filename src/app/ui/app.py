@@ -19,6 +19,7 @@ Notes:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal, cast
 
@@ -28,13 +29,15 @@ import streamlit as st
 
 from app import charts as app_charts
 from app.data import (
+    FileStamp,
     get_time_bounds,
     load_agents_tokens,
+    load_cee,
     load_events,
     load_model_specs,
-    load_object_object,
-    load_other_object,
-    load_relations,
+    load_relation_tables,
+    load_relations_at_t,
+    run_file_stamp,
 )
 from crv.viz.timeseries import (
     TimeseriesResult,
@@ -44,7 +47,111 @@ from crv.viz.timeseries import (
 )
 
 from .header import render_header
-from .helpers import compute_overview_kpis
+from .helpers import compute_overview_summary, unique_sorted
+
+
+@lru_cache(maxsize=1)
+def _metric_catalog() -> tuple[list[dict[str, Any]], dict[str, str], list[str]]:
+    """Return (metric_specs, id->label map, metric ids), built once per process.
+
+    The catalog is static for a given install; callers must treat it as read-only.
+    """
+    specs = list(list_available_metrics())
+    return specs, {spec["id"]: spec["label"] for spec in specs}, [spec["id"] for spec in specs]
+
+
+# Derivations below are keyed on (run_dir, agents_tokens stamp); the frame itself is
+# passed as an underscore argument so Streamlit skips hashing it on every rerun.
+
+
+@st.cache_data(max_entries=16)
+def _cached_time_bounds(run_dir: str, stamp: FileStamp, _at_df: pl.DataFrame) -> tuple[int, int]:
+    """Return (t_min, t_max) for a run, computed once per agents_tokens stamp."""
+    del run_dir, stamp  # cache key only
+    try:
+        return get_time_bounds(_at_df)
+    except Exception:
+        return (0, 0)
+
+
+@st.cache_data(max_entries=16)
+def _cached_id_domains(
+    run_dir: str, stamp: FileStamp, _at_df: pl.DataFrame
+) -> tuple[list[Any], list[Any], list[Any]]:
+    """Return (agent_ids, object_ids, group_values) selector domains for a run."""
+    del run_dir, stamp  # cache key only
+    return (
+        unique_sorted(_at_df, "agent_id"),
+        unique_sorted(_at_df, "o"),
+        unique_sorted(_at_df, "group"),
+    )
+
+
+@st.cache_data(max_entries=16)
+def _cached_overview(
+    run_dir: str, stamp: FileStamp, _at_df: pl.DataFrame
+) -> tuple[dict[str, float], pl.DataFrame]:
+    """Return (Overview KPIs, counts by t) from one fused pass per agents_tokens stamp."""
+    del run_dir, stamp  # cache key only
+    return compute_overview_summary(_at_df)
+
+
+@st.cache_data(max_entries=64)
+def _cached_metric_timeseries(
+    run_dir: str,
+    stamp: FileStamp,
+    metric_id: str,
+    scope: Literal["aggregate", "group", "agent"],
+    agent_ids: tuple[int, ...] | None,
+    object_ids: tuple[int, ...] | None,
+    groups: tuple[str, ...] | None,
+    quantiles: tuple[float, float] | None,
+    split_by_object: bool,
+    _at_df: pl.DataFrame,
+) -> TimeseriesResult:
+    """Return prepare_metric_timeseries output keyed on hashable filter tuples.
+
+    Widgets that do not affect the metric frame (cost line, overlays, sampling)
+    then reuse the prepared frame instead of re-aggregating at_df.
+    """
+    del run_dir, stamp  # cache key only
+    return prepare_metric_timeseries(
+        _at_df,
+        metric_id,
+        scope=scope,
+        agent_ids=list(agent_ids) if agent_ids else None,
+        object_ids=list(object_ids) if object_ids else None,
+        groups=list(groups) if groups else None,
+        quantiles=quantiles,
+        split_by_object=split_by_object,
+    )
+
+
+@st.cache_data(max_entries=16)
+def _cached_event_domains(
+    run_dir: str, stamp: FileStamp, _ev: pl.DataFrame
+) -> dict[str, list[Any]]:
+    """Return the events selector domains {"type", "i", "o"} per events stamp."""
+    del run_dir, stamp  # cache key only
+    return {column: unique_sorted(_ev, column) for column in ("type", "i", "o")}
+
+
+@st.cache_data(max_entries=16)
+def _cached_overlay_events(
+    run_dir: str,
+    stamp: FileStamp,
+    agents: tuple[int, ...] | None,
+    objects: tuple[int, ...] | None,
+    _ev: pl.DataFrame,
+) -> pl.DataFrame:
+    """Return overlay events restricted to the selected agents/objects in one filter pass."""
+    del run_dir, stamp  # cache key only
+    predicates: list[pl.Expr] = []
+    if agents:
+        predicates.append(pl.col("i").is_in(agents))
+    if objects:
+        predicates.append(pl.col("o").is_in(objects))
+    return _ev.filter(*predicates) if predicates else _ev
 
 
 def streamlit_app(
@@ -83,7 +190,9 @@ def streamlit_app(
         return
     run_path = Path(run_dir)
 
-    # Load core table (agents_tokens)
+    # Load core table (agents_tokens). The stamp is taken before loading so a file
+    # rewritten mid-load keys the derived caches on the old stamp and misses next rerun.
+    at_stamp = run_file_stamp(str(run_path), "agents_tokens.parquet")
     try:
         with st.spinner("Loading agents_tokens ..."):
             at_df = load_agents_tokens(str(run_path), cfg=cache_cfg)
@@ -95,18 +204,11 @@ def streamlit_app(
         return
 
     # Derived globals & identifiers
-    try:
-        t_min, t_max = get_time_bounds(at_df)
-    except Exception:
-        t_min, t_max = (0, 0)
+    t_min, t_max = _cached_time_bounds(str(run_path), at_stamp, at_df)
     group_field = "group" if "group" in at_df.columns else None
 
-    agent_ids_all = (
-        sorted(set(at_df.get_column("agent_id").to_list())) if "agent_id" in at_df.columns else []
-    )
-    object_ids_all = sorted(set(at_df.get_column("o").to_list())) if "o" in at_df.columns else []
-    group_values_all = (
-        sorted(set(at_df.get_column("group").drop_nulls().to_list())) if group_field else []
+    agent_ids_all, object_ids_all, group_values_all = _cached_id_domains(
+        str(run_path), at_stamp, at_df
     )
 
     # Tabs (page navigation)
@@ -129,7 +231,7 @@ def streamlit_app(
             st.caption("Failed to load run specs.")
 
         # KPIs
-        kpi = compute_overview_kpis(at_df)
+        kpi, _ = _cached_overview(str(run_path), at_stamp, at_df)
         c1, c2 = st.columns(2)
         with c1:
             st.metric("Final mean value_score", f"{kpi['final_mean_value']:.3f}")
@@ -147,9 +249,7 @@ def streamlit_app(
     # Time Series
     # ----------------------------
     with tab_ts:
-        metric_specs = list_available_metrics()
-        metric_id_to_label = {spec["id"]: spec["label"] for spec in metric_specs}
-        metric_options = [spec["id"] for spec in metric_specs]
+        _, metric_id_to_label, metric_options = _metric_catalog()
         default_metrics = [
             m for m in ("value_score", "s_io", "y_io") if m in metric_options
         ] or metric_options[:1]
@@ -249,8 +349,10 @@ def streamlit_app(
                 "Show event markers", value=False, key="ts_overlay_enabled"
             )
             events_df = None
+            ev_stamp: FileStamp = None
             overlay_types: list[str] = []
             if overlay_enabled:
+                ev_stamp = run_file_stamp(str(run_path), "events.parquet")
                 try:
                     events_df = load_events(str(run_path), cfg=cache_cfg)
                 except Exception:
@@ -259,11 +361,7 @@ def streamlit_app(
                     st.caption("No events available for overlay.")
                     overlay_enabled = False
                 else:
-                    type_opts = (
-                        sorted(set(events_df.get_column("type").to_list()))
-                        if "type" in events_df.columns
-                        else []
-                    )
+                    type_opts = _cached_event_domains(str(run_path), ev_stamp, events_df)["type"]
                     overlay_types = st.multiselect(
                         "Event types",
                         options=type_opts,
@@ -272,14 +370,11 @@ def streamlit_app(
                     )
 
         # Brush and charts
-        try:
-            counts = at_df.group_by("t").agg(pl.len().alias("n")).sort("t")
-        except Exception:
-            counts = pl.DataFrame({"t": [], "n": []})
-        top_vals = counts.to_dicts()
+        # Altair consumes the Polars frame directly (no per-row dict boxing)
+        _, counts = _cached_overview(str(run_path), at_stamp, at_df)
         brush = alt.selection_interval(name="brush_t", encodings=["x"])
         top = (
-            alt.Chart(alt.Data(values=top_vals))
+            alt.Chart(counts)
             .mark_bar()
             .encode(x="t:Q", y="n:Q")
             .add_params(brush)
@@ -293,23 +388,51 @@ def streamlit_app(
         max_points = int(st.session_state.get("ts_max_points", 500)) or None
         stride = int(st.session_state.get("ts_stride", 0)) or None
 
-        for metric_id in selected_metrics:
-            result = prepare_metric_timeseries(
-                at_df,
+        results = [
+            _cached_metric_timeseries(
+                str(run_path),
+                at_stamp,
                 metric_id,
-                scope=scope_literal,
-                agent_ids=agent_filter,
-                object_ids=object_filter,
-                groups=group_filter,
-                quantiles=quantiles_arg,
-                split_by_object=split_by_object,
+                scope_literal,
+                tuple(agent_filter) if agent_filter else None,
+                tuple(object_filter) if object_filter else None,
+                tuple(group_filter) if group_filter else None,
+                quantiles_arg,
+                bool(split_by_object),
+                at_df,
             )
+            for metric_id in selected_metrics
+        ]
+        # Sample every metric frame in one batch so Polars runs the plans in parallel;
+        # the max-points cap uses LTTB per series so spikes survive downsampling
+        frames = pl.collect_all(
+            [
+                app_charts.ts_sampling_plan(
+                    result.frame,
+                    max_points=max_points,
+                    stride=stride,
+                    y_col=result.value_field,
+                    by=[result.color_field] if result.color_field else None,
+                )
+                for result in results
+            ],
+            engine="streaming",
+        )
 
-            frame = app_charts.apply_ts_sampling(
-                result.frame,
-                max_points=max_points,
-                stride=stride,
+        # The overlay depends only on the event filters, so build it once for all metrics
+        overlay_chart = None
+        if overlay_enabled and events_df is not None and not events_df.is_empty():
+            ev = _cached_overlay_events(
+                str(run_path),
+                ev_stamp,
+                tuple(agent_filter) if agent_filter else None,
+                tuple(object_filter) if object_filter else None,
+                events_df,
             )
+            if not ev.is_empty():
+                overlay_chart = app_charts.overlay_event_rules(ev, types=overlay_types or None)
+
+        for metric_id, result, frame in zip(selected_metrics, results, frames, strict=True):
             sampled_result = TimeseriesResult(
                 frame=frame,
                 value_field=result.value_field,
@@ -325,16 +448,6 @@ def streamlit_app(
                 if cost_line_val is not None:
                     chart = app_charts.layer_with_rule_y(chart, float(cost_line_val))
 
-            overlay_chart = None
-            if overlay_enabled and events_df is not None and not events_df.is_empty():
-                ev = events_df
-                if agent_filter:
-                    ev = ev.filter(pl.col("i").is_in(agent_filter))
-                if object_filter:
-                    ev = ev.filter(pl.col("o").is_in(object_filter))
-                if not ev.is_empty():
-                    overlay_chart = app_charts.overlay_event_rules(ev, types=overlay_types or None)
-
             chart = chart.transform_filter(brush)
             if overlay_chart is not None:
                 chart = app_charts.layer_with_overlay(chart, overlay_chart.transform_filter(brush))
@@ -378,12 +491,12 @@ def streamlit_app(
             )
 
         st.subheader(f"Agent network at t = {t_sel}")
-        rel_df = load_relations(str(run_path), cfg=cache_cfg)
-        if rel_df is None:
+        rel_at_t = load_relations_at_t(str(run_path), int(t_sel), cfg=cache_cfg)
+        if rel_at_t is None:
             st.info("relations.parquet not found.")
         else:
             ch_net = app_charts.network_snapshot_chart(
-                rel_df,
+                rel_at_t,
                 at_df=at_df,
                 t_sel=int(t_sel),
                 edge_threshold=float(net_edge_thresh) if edge_mode == "Threshold" else None,
@@ -398,11 +511,7 @@ def streamlit_app(
     # ----------------------------
     with tab_id:
         with st.sidebar.expander("Identity Controls", expanded=True):
-            agent_ids = (
-                sorted(set(at_df.get_column("agent_id").to_list()))
-                if "agent_id" in at_df.columns
-                else []
-            )
+            agent_ids = agent_ids_all
             agent_sel: int | None = (
                 cast(int, st.selectbox("Agent", options=agent_ids, index=0, key="id_agent_sel"))
                 if agent_ids
@@ -425,9 +534,9 @@ def streamlit_app(
         if agent_sel is None:
             st.info("No agents in agents_tokens.")
         else:
-            rel_df = load_relations(str(run_path), cfg=cache_cfg)
-            other_df = load_other_object(str(run_path), cfg=cache_cfg)
-            oo_df = load_object_object(str(run_path), cfg=cache_cfg)
+            rel_df, other_df, oo_df = load_relation_tables(
+                str(run_path), t_sel=int(t_sel), agent=int(agent_sel), cfg=cache_cfg
+            )
             ch_id = app_charts.identity_representation_chart(
                 at_df=at_df,
                 rel_df=rel_df,
@@ -445,21 +554,23 @@ def streamlit_app(
     # Triads
     # ----------------------------
     with tab_tri:
-        other_df = load_other_object(str(run_path), cfg=cache_cfg)
         with st.sidebar.expander("Triads Controls", expanded=True):
             t_sel = st.slider(
                 "Time t", min_value=t_min, max_value=t_max, value=t_min, step=1, key="tri_t_sel"
             )
+            # Only the t_sel slice is read; agent options come from the run-wide domain,
+            # so a selected agent stays selected when t changes
+            rel_df, other_df, _ = load_relation_tables(
+                str(run_path), t_sel=int(t_sel), cfg=cache_cfg
+            )
             agent_sel: int | None = None
-            if other_df is not None and "i" in other_df.columns:
-                agent_ids = sorted(set(other_df.get_column("i").to_list()))
-                if agent_ids:
-                    agent_sel = cast(
-                        int,
-                        st.selectbox(
-                            "Agent (for triads)", options=agent_ids, index=0, key="tri_agent_sel"
-                        ),
-                    )
+            if other_df is not None and agent_ids_all:
+                agent_sel = cast(
+                    int,
+                    st.selectbox(
+                        "Agent (for triads)", options=agent_ids_all, index=0, key="tri_agent_sel"
+                    ),
+                )
             triads_top_j = st.number_input(
                 "Triads: top-J peers", min_value=1, value=3, step=1, key="tri_top_j"
             )
@@ -473,7 +584,6 @@ def streamlit_app(
         elif agent_sel is None:
             st.info("No agent available for triads.")
         else:
-            rel_df = load_relations(str(run_path), cfg=cache_cfg)
             ch_tri = app_charts.triads_chart(
                 other_df,
                 at_df=at_df,
@@ -508,64 +618,71 @@ def streamlit_app(
                 "Independent Y scales per object", value=False, key="cee_independent_y"
             )
             show_y0 = st.checkbox("Show y=0 reference line", value=True, key="cee_show_y0")
+            # Window/group filters are pushed into the parquet scan by load_cee;
+            # the full range/all groups map to None so the unfiltered load is shared.
+            cee_t_range: tuple[int, int] | None = None
+            if t_max > t_min:
+                cee_window = st.slider(
+                    "CEE time window",
+                    min_value=t_min,
+                    max_value=t_max,
+                    value=(t_min, t_max),
+                    step=1,
+                    key="cee_t_window",
+                )
+                if tuple(cee_window) != (t_min, t_max):
+                    cee_t_range = (int(cee_window[0]), int(cee_window[1]))
+            cee_groups: tuple[str, ...] | None = None
+            if group_values_all:
+                cee_group_selection = st.multiselect(
+                    "CEE groups",
+                    options=group_values_all,
+                    default=group_values_all,
+                    key="cee_group_filter",
+                )
+                if cee_group_selection and len(cee_group_selection) < len(group_values_all):
+                    cee_groups = tuple(str(g) for g in cee_group_selection)
 
         st.subheader("CEE small multiples")
-        cee_path = run_path / "cee.parquet"
-        if not cee_path.exists():
-            st.info("cee.parquet not found.")
+        try:
+            cee_df = load_cee(str(run_path), t_range=cee_t_range, groups=cee_groups, cfg=cache_cfg)
+        except ValueError as e:
+            st.error(f"Unexpected cee.parquet schema: {e}")
         else:
-            try:
-                # Minimal cached loader for CEE (Polars-first)
-                def _load_cee_impl(p: str) -> pl.DataFrame:
-                    lf = pl.scan_parquet(p)
-                    names = lf.collect_schema().names()
-                    want = [c for c in ["t", "o", "token_id", "group", "cee"] if c in names]
-                    df = lf.select(want).collect()
-                    # Normalize token_id->o if present
-                    if "o" not in df.columns and "token_id" in df.columns:
-                        df = df.rename({"token_id": "o"})
-                    return df
-
-                if cache_cfg.persist:
-                    _load_cee = st.cache_data(ttl=cache_cfg.ttl, persist="disk")(_load_cee_impl)
-                else:
-                    _load_cee = st.cache_data(ttl=cache_cfg.ttl)(_load_cee_impl)
-
-                cee_df = _load_cee(str(cee_path))
-                ch_cee = app_charts.cee_small_multiples_chart(
-                    cee_df,
-                    cee_max_points=int(cee_max_points) if cee_max_points > 0 else None,
-                    cee_stride=int(cee_stride) if cee_stride > 0 else None,
-                    object_col="o",
-                    group_col="group",
-                )
-                # Optional y=0 rule overlay
-                if show_y0:
-                    ch_cee = app_charts.layer_with_rule_y(ch_cee, 0.0)
-                # Optional independent y scales per object facet
-                if cee_independent_y:
-                    ch_cee = ch_cee.resolve_scale(y="independent")
-                st.altair_chart(cast(Any, ch_cee), theme=None, use_container_width=True)
-            except Exception as e:
-                st.error(f"Failed to load/render CEE: {e}")
+            if cee_df is None:
+                st.info("cee.parquet not found.")
+            else:
+                try:
+                    ch_cee = app_charts.cee_small_multiples_chart(
+                        cee_df,
+                        cee_max_points=int(cee_max_points) if cee_max_points > 0 else None,
+                        cee_stride=int(cee_stride) if cee_stride > 0 else None,
+                        object_col="o",
+                        group_col="group",
+                    )
+                    # Optional y=0 rule overlay
+                    if show_y0:
+                        ch_cee = app_charts.layer_with_rule_y(ch_cee, 0.0)
+                    # Optional independent y scales per object facet
+                    if cee_independent_y:
+                        ch_cee = ch_cee.resolve_scale(y="independent")
+                    st.altair_chart(cast(Any, ch_cee), theme=None, use_container_width=True)
+                except Exception as e:
+                    st.error(f"Failed to load/render CEE: {e}")
 
     # ----------------------------
     # Events
     # ----------------------------
     with tab_events:
         with st.sidebar.expander("Events Controls", expanded=True):
+            ev_stamp = run_file_stamp(str(run_path), "events.parquet")
             ev = load_events(str(run_path), cfg=cache_cfg)
             if ev is None or ev.is_empty():
                 st.info("events.parquet not found.")
             else:
-                # Options
-                if "type" in ev.columns:
-                    try:
-                        types_opts = sorted(set(ev.get_column("type").to_list()))
-                    except Exception:
-                        types_opts = []
-                else:
-                    types_opts = []
+                # Options (cached per events file stamp)
+                ev_domains = _cached_event_domains(str(run_path), ev_stamp, ev)
+                types_opts = ev_domains["type"]
                 types_sel = st.multiselect(
                     "Event types",
                     options=types_opts,
@@ -575,10 +692,7 @@ def streamlit_app(
                 filter_i = None
                 filter_o = None
                 if "i" in ev.columns:
-                    try:
-                        i_opts = sorted(set(ev.get_column("i").to_list()))
-                    except Exception:
-                        i_opts = []
+                    i_opts = ev_domains["i"]
                     if i_opts:
                         filter_i = cast(
                             Any,
@@ -590,10 +704,7 @@ def streamlit_app(
                             ),
                         )
                 if "o" in ev.columns:
-                    try:
-                        o_opts = sorted(set(ev.get_column("o").to_list()))
-                    except Exception:
-                        o_opts = []
+                    o_opts = ev_domains["o"]
                     if o_opts:
                         filter_o = cast(
                             Any,
@@ -642,9 +753,14 @@ def streamlit_app(
         except Exception as e:
             st.error(f"Failed to render agents_tokens: {e}")
 
+        try:
+            rel_df, other_df, _ = load_relation_tables(str(run_path), cfg=cache_cfg)
+        except Exception as e:
+            rel_df, other_df = None, None
+            st.error(f"Failed to load relation tables: {e}")
+
         st.subheader("relations.parquet (if present)")
         try:
-            rel_df = load_relations(str(run_path), cfg=cache_cfg)
             if rel_df is None or rel_df.is_empty():
                 st.caption("Relations not found.")
             else:
@@ -655,7 +771,6 @@ def streamlit_app(
 
         st.subheader("other_object.parquet (if present)")
         try:
-            other_df = load_other_object(str(run_path), cfg=cache_cfg)
             if other_df is None or other_df.is_empty():
                 st.caption("Other→object (b_ijo) not found.")
             else:
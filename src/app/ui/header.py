@@ -14,6 +14,9 @@ Notes:
 
 from __future__ import annotations
 
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -23,7 +26,21 @@ from app.data import CacheConfig
 from crv.viz import theme as crv_theme
 
 from .helpers import enable_vegafusion_optional, format_ts, humanize_ago
-from .runs import cached_list_runs, create_min_demo_run, list_runs_impl
+from .runs import cached_list_runs, create_min_demo_run, list_runs_impl, refresh_runs
+
+_applied_theme: str | None = None
+
+
+@lru_cache(maxsize=16)
+def _normalize_roots(watch_roots: tuple[str, ...]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Return (sorted unique scan roots, multiselect options) for the watch roots.
+
+    Memoized on the watch_roots tuple, so unchanged preferences cost one lookup
+    per rerun instead of rebuilding the sets and sorts.
+    """
+    roots = tuple(sorted(set(map(str, watch_roots or ("out",)))))
+    options = tuple(sorted({*watch_roots, "out", "runs"}))
+    return roots, options
 
 
 def render_header(
@@ -73,7 +90,7 @@ def render_header(
         st.session_state["cache_persist"] = False
 
     # Resolve runs list (cached)
-    roots = tuple(sorted(set(map(str, st.session_state["watch_roots"] or ["out"]))))
+    roots, root_options = _normalize_roots(tuple(st.session_state["watch_roots"]))
     runs = cached_list_runs(roots, 200)
 
     # If nothing in 'out', try 'runs'
@@ -95,44 +112,45 @@ def render_header(
     c1, c2, c3 = st.columns([0.42, 0.38, 0.20])
 
     # Left: Run selector and updated caption
-    option_to_path: dict[str, str] = {}
-    options: list[str] = []
+    # Run records carry resolved, unique paths (see runs.list_runs_impl). The
+    # selectbox keys on those paths and renders labels via format_func, so
+    # preselection is a dict lookup and no label->path map or options.index scan
+    # is needed; the selection also survives label changes as ages tick over.
+    paths: list[str] = []
+    labels: dict[str, str] = {}
+    path_to_index: dict[str, int] = {}
+    mtimes: dict[str, float] = {}
+    now = time.time()
     for item in runs:
-        label = f"{item['name']} — updated {humanize_ago(item['mtime'])}"
-        option_to_path[label] = item["path"]
-        options.append(label)
-    selected_label_default_index = 0
+        path = item["path"]
+        path_to_index[path] = len(paths)
+        paths.append(path)
+        mtimes[path] = item["mtime"]
+        labels[path] = f"{item['name']} — updated {humanize_ago(item['mtime'], now)}"
+    default_index = 0
 
     # Preselect by default_run if provided, else prior session state if present
     if default_run:
-        try:
-            dpath = str(Path(default_run).resolve())
-            for lab, pth in option_to_path.items():
-                if str(Path(pth).resolve()) == dpath:
-                    selected_label_default_index = options.index(lab)
-                    break
-        except Exception:
-            pass
-    elif (
-        "selected_run_label" in st.session_state
-        and st.session_state["selected_run_label"] in options
-    ):
-        selected_label_default_index = options.index(st.session_state["selected_run_label"])
+        # Discovered paths are realpaths; realpath never raises for missing paths
+        default_index = path_to_index.get(os.path.realpath(default_run), 0)
+    elif st.session_state.get("selected_run_path") in path_to_index:
+        default_index = path_to_index[st.session_state["selected_run_path"]]
 
     with c1:
-        selected_label = st.selectbox(
-            "Run",
-            options=options or ["(no runs found)"],
-            index=selected_label_default_index if options else 0,
-            key="run_selector_header",
-        )
-        selected_run_path = option_to_path.get(selected_label, "") if options else ""
+        if paths:
+            selected_run_path = st.selectbox(
+                "Run",
+                options=paths,
+                index=default_index,
+                format_func=labels.__getitem__,
+                key="run_selector_header",
+            )
+        else:
+            st.selectbox("Run", options=["(no runs found)"], index=0, key="run_selector_header")
+            selected_run_path = ""
         # Updated timestamp
         if selected_run_path:
-            try:
-                mtime = Path(selected_run_path).stat().st_mtime
-            except Exception:
-                mtime = 0.0
+            mtime = mtimes.get(selected_run_path, 0.0)
             st.caption(f"Updated: {format_ts(mtime)} ({humanize_ago(mtime)})")
         else:
             st.caption("Select a run directory containing agents_tokens.parquet.")
@@ -143,13 +161,14 @@ def render_header(
         with cols_mid[0]:
             if st.button("Refresh"):
                 st.session_state["watch_refresh_bump"] += 1
+                refresh_runs(roots, 200)
                 st.rerun()
         with cols_mid[1]:
             with st.expander("Preferences", expanded=False):
                 # Watch roots (global)
                 roots_all = st.multiselect(
                     "Watch roots",
-                    options=sorted(set(st.session_state["watch_roots"] + ["out", "runs"])),
+                    options=list(root_options),
                     default=st.session_state["watch_roots"],
                     help="Directories scanned recursively for runs.",
                     key="pref_watch_roots",
@@ -215,10 +234,13 @@ def render_header(
     theme_val: Literal["crv_light", "crv_dark"] = (
         "crv_light" if st.session_state["theme_choice"] == "crv_light" else "crv_dark"
     )
-    crv_theme.enable(theme_val)  # type: ignore[arg-type]
+    # Altair themes are process-global; only re-enable when the choice changes
+    global _applied_theme
+    if theme_val != _applied_theme:
+        crv_theme.enable(theme_val)  # type: ignore[arg-type]
+        _applied_theme = theme_val
 
     # Update selected run in state
-    st.session_state["selected_run_label"] = selected_label
     st.session_state["selected_run_path"] = selected_run_path or (default_run or "")
 
     # Build cache config for loaders
@@ -8,16 +8,20 @@ circular imports and makes per-tab modules leaner.
 Notes:
     - All functions include Google-style docstrings.
     - This module is UI-adjacent (uses Altair and Streamlit-friendly utilities)
-      but contains no Streamlit state manipulation itself.
+      but contains no Streamlit state manipulation itself. Altair is imported
+      lazily inside enable_vegafusion_optional, its only user.
 """
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import time
+from typing import Any
 
-import altair as alt
 import polars as pl
 
+_UNSET: Any = object()
+_vegafusion_status: str | None = _UNSET
+
 
 def enable_vegafusion_optional() -> str | None:
     """Attempt to enable the VegaFusion accelerator for Altair if available.
@@ -28,29 +32,36 @@ def enable_vegafusion_optional() -> str | None:
     Notes:
         This is an optional performance accelerator. If the environment does not
         have VegaFusion installed or configured, the function will fail silently
-        and return None.
+        and return None. The outcome is memoized per process, so reruns skip the
+        Altair registry lookup and import probe.
     """
+    global _vegafusion_status
+    if _vegafusion_status is not _UNSET:
+        return _vegafusion_status
     try:
+        import altair as alt  # deferred: the only Altair use in this module
+
         alt.data_transformers.enable("vegafusion")
-        return "VegaFusion enabled (optional accelerator)."
+        _vegafusion_status = "VegaFusion enabled (optional accelerator)."
     except Exception:
-        return None
+        _vegafusion_status = None
+    return _vegafusion_status
 
 
-def humanize_ago(ts: float) -> str:
+def humanize_ago(ts: float, now: float | None = None) -> str:
     """Convert a UNIX timestamp into a short humanized age string.
 
     Args:
         ts (float): UNIX timestamp (seconds since epoch).
+        now (float | None): Reference time; defaults to time.time(). Callers
+            formatting many timestamps can read the clock once and pass it in.
 
     Returns:
         str: Humanized string like "32s ago", "5m ago", "2h ago", "3d ago",
         or "n/a" if conversion fails.
     """
     try:
-        dt = datetime.fromtimestamp(ts, tz=UTC)
-        now = datetime.now(tz=UTC)
-        delta = (now - dt).total_seconds()
+        delta = (time.time() if now is None else now) - float(ts)
         if delta < 60:
             return f"{int(delta)}s ago"
         if delta < 3600:
@@ -72,13 +83,71 @@ def format_ts(ts: float) -> str:
         str: Formatted timestamp "YYYY-MM-DD HH:MM:SS", or "n/a" on failure.
     """
     try:
-        dt = datetime.fromtimestamp(ts)
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
     except Exception:
         return "n/a"
 
 
-def compute_overview_kpis(at_df: pl.DataFrame) -> dict[str, float]:
+def unique_sorted(df: pl.DataFrame, column: str) -> list[Any]:
+    """Return the sorted distinct non-null values of a column for selector options.
+
+    Args:
+        df (pl.DataFrame): Source DataFrame.
+        column (str): Column to collect values from.
+
+    Returns:
+        list[Any]: Sorted unique values with nulls dropped, or [] if the column is absent.
+
+    Notes:
+        Deduplication and sorting run natively in Polars, so only the distinct
+        values are converted to Python objects.
+    """
+    if column not in df.columns:
+        return []
+    return df.get_column(column).drop_nulls().unique().sort().to_list()
+
+
+def compute_overview_summary(
+    at_df: pl.DataFrame | pl.LazyFrame,
+) -> tuple[dict[str, float], pl.DataFrame]:
+    """Compute Overview KPIs and row counts by t in a single group-by pass.
+
+    Args:
+        at_df (pl.DataFrame | pl.LazyFrame): Normalized agents_tokens frame. Expected
+            to include column "t". If not present, zero KPIs and empty counts are returned.
+
+    Returns:
+        tuple[dict[str, float], pl.DataFrame]: KPI dictionary (see compute_overview_kpis)
+        and counts with columns "t" and "n", sorted by t.
+
+    Notes:
+        Per-t mean value_score and holdings rate are aggregated alongside the counts,
+        so the KPIs are read from the final row instead of re-filtering at_df. This is
+        the helper the Overview tab calls.
+    """
+    zeros = {"final_mean_value": 0.0, "final_hold_rate": 0.0}
+    lf = at_df.lazy()
+    cols = lf.collect_schema().names()
+    if "t" not in cols:
+        return zeros, pl.DataFrame({"t": [], "n": []})
+    aggs = [pl.len().alias("n")]
+    if "value_score" in cols:
+        aggs.append(pl.col("value_score").mean().alias("_mean_value"))
+    if "y_io" in cols:
+        aggs.append((pl.col("y_io") == 1).cast(pl.Float64).mean().alias("_hold_rate"))
+    per_t = lf.group_by("t").agg(aggs).sort("t").collect()
+    counts = per_t.select(["t", "n"])
+    if per_t.is_empty():
+        return zeros, counts
+    last = per_t.row(per_t.height - 1, named=True)
+    kpi = {
+        "final_mean_value": float(last.get("_mean_value") or 0.0),
+        "final_hold_rate": float(last.get("_hold_rate") or 0.0),
+    }
+    return kpi, counts
+
+
+def compute_overview_kpis(at_df: pl.DataFrame | pl.LazyFrame) -> dict[str, float]:
     """Compute quick KPI metrics from a normalized agents_tokens DataFrame.
 
     Computes:
@@ -86,30 +155,13 @@ def compute_overview_kpis(at_df: pl.DataFrame) -> dict[str, float]:
         - final_hold_rate: Share of rows with y_io == 1 at the final time t.
 
     Args:
-        at_df (pl.DataFrame): Normalized agents_tokens Polars DataFrame. Expected
+        at_df (pl.DataFrame | pl.LazyFrame): Normalized agents_tokens frame. Expected
             to include column "t". If not present, zeros are returned.
 
     Returns:
         dict[str, float]: KPI dictionary with keys "final_mean_value" and "final_hold_rate".
+
+    Notes:
+        Delegates to compute_overview_summary, so both share one KPI definition.
     """
-    if at_df.is_empty() or "t" not in at_df.columns:
-        return {"final_mean_value": 0.0, "final_hold_rate": 0.0}
-    # Use aggregation to avoid Optional typing issues with Series.max
-    tmax_df = at_df.select(pl.col("t").max().alias("_tmax"))
-    t_max = int(tmax_df.get_column("_tmax").item())
-    last = at_df.filter(pl.col("t") == t_max)
-    # Mean valuation (robust scalar extraction)
-    if "value_score" in last.columns:
-        mdf = last.select(pl.col("value_score").mean().alias("_m"))
-        mean_val = float(mdf.get_column("_m").item())
-    else:
-        mean_val = 0.0
-    # Holdings rate (share of y_io == 1)
-    if "y_io" in last.columns:
-        hr_df = last.with_columns(((pl.col("y_io") == 1).cast(pl.Float64)).alias("_held")).select(
-            pl.col("_held").mean().alias("_m")
-        )
-        hold_rate = float(hr_df.get_column("_m").item())
-    else:
-        hold_rate = 0.0
-    return {"final_mean_value": mean_val, "final_hold_rate": hold_rate}
+    return compute_overview_summary(at_df)[0]
@@ -13,8 +13,12 @@ Notes:
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
-from collections.abc import Iterable
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -23,6 +27,58 @@ import streamlit as st
 
 # Public constants
 IGNORED_DIRS: set[str] = {".venv", "site", ".git", "node_modules", "__pycache__"}
+DISCOVERY_CACHE_DIR: Path = Path.home() / ".cache" / "crv"
+DISCOVERY_CACHE_MAX_AGE_S: int = 60
+
+
+def _is_run_listing(names: set[str]) -> bool:
+    """Return True if a directory listing qualifies as a self-contained run."""
+    if "agents_tokens.parquet" not in names:
+        return False
+    if "model.parquet" in names or "metadata.json" in names:
+        return True
+    return any(n.startswith("manifest_") and n.endswith(".json") for n in names)
+
+
+def _scan_runs(base: Path) -> Iterator[tuple[str, float]]:
+    """Yield (resolved_path, mtime) for leaf-most run directories under base.
+
+    The root is resolved once; since symlinked directories are never followed,
+    every path built below it is already canonical and needs no per-run resolve().
+    The mtime comes from the run directory's DirEntry found during the walk.
+    """
+    if not base.is_dir():
+        return
+    root = os.path.realpath(base)
+    # Stack entries are (path, entry, None) before listing and (path, entry, is_run)
+    # once the children have been pushed, so the second visit follows the subtree.
+    stack: list[tuple[str, os.DirEntry[str] | None, bool | None]] = [(root, None, None)]
+    run_below: set[str] = set()
+    while stack:
+        current, dir_entry, is_run = stack.pop()
+        if is_run is not None:
+            below = current in run_below
+            if is_run and not below and dir_entry is not None:
+                try:
+                    mtime = dir_entry.stat(follow_symlinks=False).st_mtime
+                except OSError:
+                    mtime = 0.0
+                yield current, mtime
+            if is_run or below:
+                run_below.add(os.path.dirname(current))
+            continue
+        names: set[str] = set()
+        subdirs: list[os.DirEntry[str]] = []
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    names.add(entry.name)
+                    if entry.name not in IGNORED_DIRS and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry)
+        except OSError:
+            continue
+        stack.append((current, dir_entry, current != root and _is_run_listing(names)))
+        stack.extend((e.path, e, None) for e in subdirs)
 
 
 def list_recent_runs_under(base: Path) -> Iterable[Path]:
@@ -38,29 +94,20 @@ def list_recent_runs_under(base: Path) -> Iterable[Path]:
         base (Path): Base directory to scan recursively.
 
     Yields:
-        Path: Paths to run directories that satisfy the conditions.
+        Path: Resolved paths to leaf-most run directories that satisfy the conditions.
 
     Notes:
-        - Directory trees matching IGNORED_DIRS are skipped.
+        - Directory trees matching IGNORED_DIRS are pruned before descending.
+        - Traversal is an explicit DFS over os.scandir: each directory is listed
+          once, and that single listing both qualifies it as a run and supplies its
+          subdirectories (DirEntry.is_dir reuses the readdir d_type, so files are
+          never stat'ed). Symlinked directories are not followed.
+        - Runs may nest; a run is yielded only when no run exists below it. This is
+          decided post-order during the walk, so callers need no ancestor pruning.
         - This function is IO-bound and intended to be called from a cached wrapper.
     """
-    if not base.exists() or not base.is_dir():
-        return []
-    for p in base.rglob("*"):
-        if not p.is_dir():
-            continue
-        if any(seg in IGNORED_DIRS for seg in p.parts):
-            continue
-        at = p / "agents_tokens.parquet"
-        if not at.exists():
-            continue
-        model_ok = (p / "model.parquet").exists() or (p / "metadata.json").exists()
-        manifest_ok = any(
-            child.name.startswith("manifest_") and child.suffix == ".json"
-            for child in p.glob("manifest_*.json")
-        )
-        if model_ok or manifest_ok:
-            yield p
+    for path, _ in _scan_runs(base):
+        yield Path(path)
 
 
 def list_runs_impl(roots: list[str], limit: int = 200) -> list[dict[str, Any]]:
@@ -75,41 +122,120 @@ def list_runs_impl(roots: list[str], limit: int = 200) -> list[dict[str, Any]]:
 
     Notes:
         - Resolves duplicates by absolute path.
-        - Prefers leaf-most directories and sorts by recency (mtime).
+        - Prefers leaf-most directories (see list_recent_runs_under) and keeps the
+          most recent runs by mtime.
     """
     seen: set[str] = set()
     items: list[dict[str, Any]] = []
-    for root in roots:
-        base = Path(root)
-        for p in list_recent_runs_under(base):
-            sp = str(p.resolve())
+    # Root walks are syscall-bound, so scan roots concurrently; results are merged
+    # in root order to keep deduplication deterministic.
+    if len(roots) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(roots))) as ex:
+            per_root = list(ex.map(lambda r: list(_scan_runs(Path(r))), roots))
+    else:
+        per_root = [list(_scan_runs(Path(r))) for r in roots]
+    for found in per_root:
+        for sp, mtime in found:
             if sp in seen:
                 continue
             seen.add(sp)
-            try:
-                mtime = p.stat().st_mtime
-            except Exception:
-                mtime = 0.0
-            items.append({"path": sp, "name": p.name, "mtime": mtime})
-
-    # Prefer deeper paths first (leaves), then prune ancestors, then sort by recency.
-    items_by_depth = sorted(items, key=lambda d: len(Path(d["path"]).parts), reverse=True)
-    pruned: list[dict[str, Any]] = []
-    kept_paths: list[Path] = []
-    for d in items_by_depth:
-        p = Path(d["path"])
-        if any(str(kp).startswith(str(p) + os.sep) or str(kp) == str(p) for kp in kept_paths):
-            continue
-        pruned.append(d)
-        kept_paths.append(p)
-        if len(pruned) >= limit:
-            break
+            items.append({"path": sp, "name": os.path.basename(sp), "mtime": mtime})
+
+    # The scanner already yields leaf-most runs only; keep the most recent.
+    items.sort(key=lambda d: d["mtime"], reverse=True)
+    return items[:limit]
+
+
+def _dir_stamps(path: str, depth: int, stamps: list[tuple[str, int]]) -> None:
+    """Append (path, mtime_ns) for non-ignored subdirectories of path, depth levels down."""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name not in IGNORED_DIRS and entry.is_dir(follow_symlinks=False):
+                stamps.append((entry.path, entry.stat(follow_symlinks=False).st_mtime_ns))
+                if depth > 1:
+                    try:
+                        _dir_stamps(entry.path, depth - 1, stamps)
+                    except OSError:
+                        pass
 
-    pruned.sort(key=lambda d: d["mtime"], reverse=True)
-    return pruned
+
+def _discovery_key(roots: tuple[str, ...], limit: int) -> str:
+    """Return a digest of (roots, mtimes of directories up to two levels down, limit).
+
+    Covers the <root>/runs/<run_id>/ layout: creating a run directory re-keys via its
+    parent, and writing agents_tokens.parquet/metadata.json after mkdir re-keys via
+    the run directory itself. Changes deeper than that rely on the cache TTL.
+    """
+    stamps: list[tuple[str, int]] = []
+    for root in roots:
+        try:
+            stamps.append((os.path.abspath(root), os.stat(root).st_mtime_ns))
+            _dir_stamps(root, 2, stamps)
+        except OSError:
+            stamps.append((os.path.abspath(root), 0))
+    payload = repr((sorted(stamps), limit)).encode("utf-8")
+    return hashlib.md5(payload, usedforsecurity=False).hexdigest()
+
+
+def _entry_is_current(run: dict[str, Any]) -> bool:
+    """Return True if a cached run entry still exists with its recorded mtime."""
+    try:
+        return bool(os.stat(run["path"], follow_symlinks=False).st_mtime == run["mtime"])
+    except OSError:
+        return False
+
+
+def list_runs_disk_cached(
+    roots: tuple[str, ...],
+    limit: int = 200,
+    *,
+    force_rescan: bool = False,
+    cache_dir: Path | None = None,
+) -> list[dict[str, Any]]:
+    """Return list_runs_impl results through a disk cache shared across sessions.
+
+    Args:
+        roots (tuple[str, ...]): Root directories to scan.
+        limit (int): Maximum number of entries (best-effort).
+        force_rescan (bool): Ignore any cached entry and rescan (the entry is rewritten).
+        cache_dir (Path | None): Cache directory; defaults to DISCOVERY_CACHE_DIR.
+
+    Returns:
+        list[dict[str, Any]]: Run metadata entries.
+
+    Notes:
+        Entries are JSON files named by _discovery_key and expire after
+        DISCOVERY_CACHE_MAX_AGE_S. A hit is reused only while every cached run
+        still exists with its recorded mtime, so deleted or rewritten runs force a
+        rescan. Cache IO errors fall back to a plain scan.
+    """
+    directory = cache_dir if cache_dir is not None else DISCOVERY_CACHE_DIR
+    path = directory / f"runs_{_discovery_key(roots, limit)}.json"
+    if not force_rescan:
+        try:
+            if time.time() - path.stat().st_mtime < DISCOVERY_CACHE_MAX_AGE_S:
+                cached: list[dict[str, Any]] = json.loads(path.read_text(encoding="utf-8"))
+                if all(_entry_is_current(r) for r in cached):
+                    return cached
+        except (OSError, ValueError):
+            pass
+    runs = list_runs_impl(list(roots), limit)
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(runs), encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        pass
+    return runs
+
+
+@st.cache_data(ttl=10, max_entries=32)
+def _cached_list_runs_keyed(roots: tuple[str, ...], limit: int, key: str) -> list[dict[str, Any]]:
+    del key  # cache key only
+    return list_runs_disk_cached(roots, limit)
 
 
-@st.cache_data(ttl=10)
 def cached_list_runs(roots: tuple[str, ...], limit: int = 200) -> list[dict[str, Any]]:
     """Streamlit-cached wrapper for listing runs.
 
@@ -121,10 +247,18 @@ def cached_list_runs(roots: tuple[str, ...], limit: int = 200) -> list[dict[str,
         list[dict[str, Any]]: Run metadata entries.
 
     Notes:
-        The default ttl is short; callers can control refresh by varying inputs or
-        using a session-state bump to re-key calls.
+        The cache is keyed on _discovery_key (directory mtimes up to two levels
+        below each root), so a new or newly completed run near a root is picked up
+        on the next rerun; a short TTL backstops deeper layouts. Misses go through
+        the disk-backed list_runs_disk_cached. Use refresh_runs to force a rescan.
     """
-    return list_runs_impl(list(roots), limit)
+    return _cached_list_runs_keyed(roots, limit, _discovery_key(roots, limit))
+
+
+def refresh_runs(roots: tuple[str, ...], limit: int = 200) -> None:
+    """Drop cached discovery results for all roots and rescan roots now."""
+    _cached_list_runs_keyed.clear()
+    list_runs_disk_cached(roots, limit, force_rescan=True)
 
 
 def create_min_demo_run(run_dir: Path) -> None:
@@ -142,6 +276,7 @@ def create_min_demo_run(run_dir: Path) -> None:
         - Creates model.parquet with minimal specs.
     """
     run_dir.mkdir(parents=True, exist_ok=True)
+    # Demo tables are a few rows each, so they are written without a compression codec
 
     # Minimal agents_tokens with Mesa v3+ schema (step->t, token_id->o normalization downstream)
     at = pl.DataFrame(
@@ -155,17 +290,17 @@ def create_min_demo_run(run_dir: Path) -> None:
             "group": ["A", "A", "A", "B", "B", "B"],
         }
     )
-    at.write_parquet(run_dir / "agents_tokens.parquet")
+    at.write_parquet(run_dir / "agents_tokens.parquet", compression="uncompressed")
 
     # Minimal relations and other_object
     rel = pl.DataFrame({"step": [0, 0], "i": [0, 1], "j": [1, 0], "a_ij": [0.8, -0.3]})
-    rel.write_parquet(run_dir / "relations.parquet")
+    rel.write_parquet(run_dir / "relations.parquet", compression="uncompressed")
 
     bdf = pl.DataFrame(
         {"step": [0, 0], "i": [0, 0], "j": [1, 1], "o": [0, 1], "b_ijo": [0.5, -0.2]}
     )
-    bdf.write_parquet(run_dir / "other_object.parquet")
+    bdf.write_parquet(run_dir / "other_object.parquet", compression="uncompressed")
 
     # Minimal model.parquet for specs
     model = pl.DataFrame({"seed": [123], "n_agents": [2], "n_tokens": [2], "k": [1], "steps": [3]})
-    model.write_parquet(run_dir / "model.parquet")
+    model.write_parquet(run_dir / "model.parquet", compression="uncompressed")
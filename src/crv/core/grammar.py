@@ -13,6 +13,7 @@ import re
 from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Final
 
@@ -112,6 +113,8 @@ class ParsedGrammar:
 _COMMENT_RE = re.compile(r"\(\*.*?\*\)", re.DOTALL)
 _RULE_RE = re.compile(r"(?ms)^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*;")
 _LITERAL_RE = re.compile(r"[\"']([^\"']+)[\"']")
+# Quoted literal (backslash escapes, may be unterminated) or a single bracket/bar.
+_STRUCTURE_RE = re.compile(r"\"(?:\\.|[^\"\\])*\"?|'(?:\\.|[^'\\])*'?|[()\[\]{}|]", re.DOTALL)
 
 
 def _strip_ebnf_comments(text: str) -> str:
@@ -119,40 +122,23 @@ def _strip_ebnf_comments(text: str) -> str:
 
 
 def _split_alternatives(expression: str) -> tuple[str, ...]:
+    # Split on top-level "|" by jumping between structural tokens (quoted
+    # literals, brackets, bars) instead of walking every character.
     parts: list[str] = []
-    buffer: list[str] = []
     depth = 0
-    quote: str | None = None
-    i = 0
-    while i < len(expression):
-        ch = expression[i]
-        if quote is not None:
-            buffer.append(ch)
-            if ch == quote:
-                quote = None
-            elif ch == "\\" and i + 1 < len(expression):
-                i += 1
-                buffer.append(expression[i])
-            i += 1
-            continue
-        if ch in ('"', "'"):
-            quote = ch
-            buffer.append(ch)
-        elif ch in "([{":
+    start = 0
+    for match in _STRUCTURE_RE.finditer(expression):
+        token = match.group()
+        if token in "([{":
             depth += 1
-            buffer.append(ch)
-        elif ch in ")]}":
+        elif token in ")]}":
             depth = max(0, depth - 1)
-            buffer.append(ch)
-        elif ch == "|" and depth == 0:
-            part = "".join(buffer).strip()
+        elif token == "|" and depth == 0:
+            part = expression[start : match.start()].strip()
             if part:
                 parts.append(part)
-            buffer = []
-        else:
-            buffer.append(ch)
-        i += 1
-    tail = "".join(buffer).strip()
+            start = match.end()
+    tail = expression[start:].strip()
     if tail:
         parts.append(tail)
     return tuple(parts)
@@ -164,13 +150,8 @@ def _first_literal(alt: str) -> str | None:
 
 
 def _dedupe_preserving_order(items: Iterable[str]) -> tuple[str, ...]:
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for item in items:
-        if item not in seen:
-            seen.add(item)
-            ordered.append(item)
-    return tuple(ordered)
+    # dicts keep insertion order, so fromkeys dedupes in C with first-seen order.
+    return tuple(dict.fromkeys(items))
 
 
 # ============================================================================
@@ -443,9 +424,11 @@ class TableDescriptor:
 # Helpers & Validators (zero I/O)
 # ============================================================================
 
-_LOWER_SNAKE_RE: Final[re.Pattern[str]] = re.compile(r"^[a-z0-9]+(?:_[a-z0-9]+)*$")
+# Reference definition of lower_snake; is_lower_snake implements it without regex.
+_LOWER_SNAKE_RE: Final[re.Pattern[str]] = re.compile(r"[a-z0-9]+(?:_[a-z0-9]+)*")
 
 
+@lru_cache(maxsize=4096)
 def is_lower_snake(value: str) -> bool:
     """
     Check whether a string is lower_snake.
@@ -456,13 +439,26 @@ def is_lower_snake(value: str) -> bool:
     Returns:
       bool: True if value matches lower_snake (e.g., "acquire_token"), False otherwise.
 
+    Notes:
+      Memoized with lru_cache: validators see the same few tokens on every row.
+
     Examples:
       >>> is_lower_snake("acquire_token")
       True
       >>> is_lower_snake("AcquireToken")
       False
     """
-    return bool(_LOWER_SNAKE_RE.match(value or ""))
+    # Equivalent to _LOWER_SNAKE_RE using C-level str predicates only: ASCII
+    # [a-z0-9_] characters, no leading/trailing or doubled underscores.
+    return (
+        bool(value)
+        and value.isascii()
+        and value.replace("_", "a").isalnum()
+        and value == value.lower()
+        and value[0] != "_"
+        and value[-1] != "_"
+        and "__" not in value
+    )
 
 
 def assert_lower_snake(value: str, what: str = "value") -> None:
@@ -480,6 +476,16 @@ def assert_lower_snake(value: str, what: str = "value") -> None:
         raise ValueError(f"{what} must be lower_snake (got: {value!r})")
 
 
+# Value -> member maps for the *_from_value parsers. Every enum value is
+# lower_snake (see ensure_all_enum_values_lower_snake), so a hit needs no regex
+# validation.
+_ACTION_BY_VALUE: Final[dict[str, ActionKind]] = {m.value: m for m in ActionKind}
+_EXCHANGE_BY_VALUE: Final[dict[str, ExchangeKind]] = {m.value: m for m in ExchangeKind}
+_EDGE_BY_VALUE: Final[dict[str, RepresentationEdgeKind]] = {
+    m.value: m for m in RepresentationEdgeKind
+}
+
+
 def action_value(kind: ActionKind) -> str:
     """
     Get the serialized (lower_snake) value for an ActionKind.
@@ -506,8 +512,11 @@ def action_kind_from_value(s: str) -> ActionKind:
     Raises:
       ValueError: If s is not lower_snake or is not a known action.
     """
-    assert_lower_snake(s, "action_type")
-    return ActionKind(s)
+    kind = _ACTION_BY_VALUE.get(s)
+    if kind is None:
+        assert_lower_snake(s, "action_type")
+        return ActionKind(s)  # raises ValueError for unknown values
+    return kind
 
 
 def exchange_value(kind: ExchangeKind) -> str:
@@ -536,8 +545,11 @@ def exchange_kind_from_value(s: str) -> ExchangeKind:
     Raises:
       ValueError: If s is not lower_snake or is not a known exchange kind.
     """
-    assert_lower_snake(s, "exchange_event_type")
-    return ExchangeKind(s)
+    kind = _EXCHANGE_BY_VALUE.get(s)
+    if kind is None:
+        assert_lower_snake(s, "exchange_event_type")
+        return ExchangeKind(s)  # raises ValueError for unknown values
+    return kind
 
 
 def edge_value(kind: RepresentationEdgeKind) -> str:
@@ -566,8 +578,18 @@ def edge_kind_from_value(s: str) -> RepresentationEdgeKind:
     Raises:
       ValueError: If s is not lower_snake or is not a known edge kind.
     """
-    assert_lower_snake(s, "edge_kind")
-    return RepresentationEdgeKind(s)
+    kind = _EDGE_BY_VALUE.get(s)
+    if kind is None:
+        assert_lower_snake(s, "edge_kind")
+        return RepresentationEdgeKind(s)  # raises ValueError for unknown values
+    return kind
+
+
+# value -> the enum's own value object, so normalized tokens share one str per value.
+_VISIBILITY_VALUES: Final[dict[str, str]] = {v.value: v.value for v in Visibility}
+_CHANNEL_TYPE_VALUES: Final[dict[str, str]] = {c.value: c.value for c in ChannelType}
+_VISIBILITY_SORTED: Final[list[str]] = sorted(_VISIBILITY_VALUES)
+_CHANNEL_TYPE_SORTED: Final[list[str]] = sorted(_CHANNEL_TYPE_VALUES)
 
 
 def normalize_visibility(vis: str) -> str:
@@ -589,11 +611,10 @@ def normalize_visibility(vis: str) -> str:
         - scenarios_seen.visibility_scope
         - event envelopes visibility field
     """
-    vis_l = (vis or "").lower()
-    allowed = {v.value for v in Visibility}
-    if vis_l not in allowed:
-        raise ValueError(f"visibility must be one of {sorted(allowed)} (got {vis!r})")
-    return vis_l
+    canonical = _VISIBILITY_VALUES.get((vis or "").lower())
+    if canonical is None:
+        raise ValueError(f"visibility must be one of {_VISIBILITY_SORTED} (got {vis!r})")
+    return canonical
 
 
 def normalize_channel_type(ch: str) -> str:
@@ -612,11 +633,10 @@ def normalize_channel_type(ch: str) -> str:
     Notes:
       Typically used only for validation when parsing a channel prefix.
     """
-    ch_l = (ch or "").lower()
-    allowed = {c.value for c in ChannelType}
-    if ch_l not in allowed:
-        raise ValueError(f"channel type must be one of {sorted(allowed)} (got {ch!r})")
-    return ch_l
+    canonical = _CHANNEL_TYPE_VALUES.get((ch or "").lower())
+    if canonical is None:
+        raise ValueError(f"channel type must be one of {_CHANNEL_TYPE_SORTED} (got {ch!r})")
+    return canonical
 
 
 def canonical_action_key(action_type: ActionKind, **params: object) -> str:
@@ -644,11 +664,12 @@ def canonical_action_key(action_type: ActionKind, **params: object) -> str:
         - decisions.action_candidates[].key (string)
         - logs / dashboards (viz) as human-readable labels
     """
-    parts = [action_type.value]
-    if params:
-        ordered = ", ".join(f"{k}={v}" for k, v in sorted(params.items()))
-        parts.append(ordered.replace(", ", "|"))
-    return ":".join(parts)
+    if not params:
+        return action_type.value
+    # Join on "|" directly; the replace keeps the historical mapping of ", " inside
+    # values to "|" (the old ", "-join-then-replace produced the same string).
+    ordered = "|".join([f"{k}={v}" for k, v in sorted(params.items())])
+    return f"{action_type.value}:{ordered.replace(', ', '|')}"
 
 
 def ensure_all_enum_values_lower_snake(enums: Iterable[type[Enum]]) -> None:
@@ -699,5 +720,7 @@ def _assert_production_matches_enum(
 
 
 PARSED_GRAMMAR: Final[ParsedGrammar] = ParsedGrammar.from_text(EBNF_GRAMMAR)
-_assert_production_matches_enum(PARSED_GRAMMAR, "action_request", ActionKind)
-_assert_production_matches_enum(PARSED_GRAMMAR, "patch_edit", PatchOp)
+# Developer invariant (also covered by tests/core/test_grammar_sync.py); skipped under -O.
+if __debug__:
+    _assert_production_matches_enum(PARSED_GRAMMAR, "action_request", ActionKind)
+    _assert_production_matches_enum(PARSED_GRAMMAR, "patch_edit", PatchOp)
@@ -1,7 +1,7 @@
 """
 Canonical JSON serialization and hashing helpers for core schemas.
 
-Provides a single canonical JSON policy and SHA-256 helpers to ensure stable,
+Provides a single canonical JSON policy and hashing helpers to ensure stable,
 order-insensitive serialization and hashing across runs and consumers. This
 module is zero-IO and uses only the Python standard library.
 
@@ -11,6 +11,13 @@ Notes:
         - separators=(",", ":")
         - ensure_ascii=False
     - Hashing is performed over the UTF-8 encoded canonical JSON string.
+    - The digest is SHA-256 by default. Setting CRV_HASH_ALGO=blake2b (read once
+      at import) switches to BLAKE2b with a 32-byte digest, which is faster on
+      short inputs; identifiers change on opt-in, so leave it unset to
+      reproduce existing digests.
+    - Flat mappings (str keys, scalar values) are memoized on a frozen,
+      type-tagged key; nested mappings always take the uncached path, which
+      streams top-level entries into the hasher instead of building one string.
     - Used by core/tests/downstream packages to keep identifiers stable.
 
 References:
@@ -21,7 +28,10 @@ from __future__ import annotations
 
 import hashlib
 import json
-from collections.abc import Mapping
+import math
+import os
+from collections.abc import Callable, Mapping
+from functools import lru_cache
 from typing import Any
 
 __all__ = [
@@ -32,6 +42,11 @@ __all__ = [
 ]
 
 
+# json.dumps builds a fresh JSONEncoder whenever non-default options are passed;
+# reusing one configured instance skips that per call.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
 def json_dumps_canonical(obj: Any) -> str:
     """
     Serialize an object to a canonical JSON string.
@@ -47,16 +62,91 @@ def json_dumps_canonical(obj: Any) -> str:
         This function assumes the input is JSON-serializable and does not perform
         coercion of unsupported types.
     """
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return _CANONICAL_ENCODER.encode(obj)
+
+
+_HASHERS: dict[str, Callable[..., Any]] = {
+    "sha256": hashlib.sha256,
+    "blake2b": lambda data=b"": hashlib.blake2b(data, digest_size=32),
+}
+
+
+def _resolve_hasher(name: str) -> Callable[..., Any]:
+    """Return the hashlib constructor for a CRV_HASH_ALGO value."""
+    try:
+        return _HASHERS[name.strip().lower()]
+    except KeyError:
+        raise ValueError(
+            f"unsupported CRV_HASH_ALGO {name!r}; expected one of {sorted(_HASHERS)}"
+        ) from None
+
+
+_HASHER = _resolve_hasher(os.environ.get("CRV_HASH_ALGO") or "sha256")
+
+
+def _hexdigest(s: str) -> str:
+    """Compute the configured hex digest (SHA-256 by default) of a UTF-8 string."""
+    return _HASHER(s.encode("utf-8")).hexdigest()
 
 
-def _sha256_hexdigest(s: str) -> str:
-    """Compute SHA-256 hex digest of a UTF-8 string."""
-    h = hashlib.sha256()
-    h.update(s.encode("utf-8"))
+# Types whose equality implies identical canonical JSON once tagged with the type
+# (bool vs int vs float must not collide: True == 1 == 1.0 as dict keys).
+_FLAT_SCALARS = frozenset({str, int, bool, float, type(None)})
+
+
+def _freeze_flat(m: Mapping[str, Any]) -> tuple[tuple[Any, ...], ...] | None:
+    """Return a hashable, order-insensitive key for a flat mapping, else None."""
+    items: list[tuple[Any, ...]] = []
+    for k, v in m.items():
+        t = type(v)
+        if type(k) is not str or t not in _FLAT_SCALARS:
+            return None
+        if t is float and v == 0.0:
+            # 0.0 == -0.0 but they serialize differently
+            items.append((k, t, v, math.copysign(1.0, v)))
+        else:
+            items.append((k, t, v))
+    items.sort()
+    return tuple(items)
+
+
+@lru_cache(maxsize=65536)
+def _hash_frozen(key: tuple[tuple[Any, ...], ...]) -> str:
+    """Hash a mapping frozen by _freeze_flat (memoized)."""
+    return _hash_uncached({item[0]: item[2] for item in key})
+
+
+def _hash_uncached(m: Mapping[str, Any]) -> str:
+    """Hash a mapping's canonical JSON without consulting the cache.
+
+    With str keys, the top-level object is streamed into the hasher one sorted
+    entry at a time, so peak memory is the largest value's JSON rather than the
+    whole document; the bytes fed in are exactly the canonical JSON.
+    """
+    if not all(type(k) is str for k in m):
+        # Non-str keys follow json's key coercion; use the one-shot path
+        return _hexdigest(json_dumps_canonical(dict(m)))
+    h = _HASHER()
+    encode = _CANONICAL_ENCODER.encode
+    sep = b"{"
+    for k, v in sorted(m.items()):
+        h.update(sep)
+        h.update(encode(k).encode("utf-8"))
+        h.update(b":")
+        h.update(encode(v).encode("utf-8"))
+        sep = b","
+    h.update(b"}" if sep == b"," else b"{}")
     return h.hexdigest()
 
 
+def _hash_mapping(m: Mapping[str, Any]) -> str:
+    """Hash a mapping, using the memoized path for flat mappings."""
+    key = _freeze_flat(m)
+    if key is None:
+        return _hash_uncached(m)
+    return _hash_frozen(key)
+
+
 def hash_row(row: Mapping[str, Any]) -> str:
     """
     Compute a stable hash for a row-like mapping by hashing its canonical JSON.
@@ -65,40 +155,40 @@ def hash_row(row: Mapping[str, Any]) -> str:
         row (Mapping[str, Any]): Row mapping (e.g., dict) to hash.
 
     Returns:
-        str: SHA-256 hex digest over the canonical JSON serialization.
+        str: Hex digest (SHA-256 by default) over the canonical JSON serialization.
 
     Notes:
         Re-ordering keys in the mapping does not change the result.
     """
-    return _sha256_hexdigest(json_dumps_canonical(dict(row)))
+    return _hash_mapping(row)
 
 
 def hash_context(ctx_json: Mapping[str, Any]) -> str:
     """
-    Hash a context-like mapping using canonical JSON and SHA-256 policy.
+    Hash a context-like mapping using the canonical JSON and hashing policy.
 
     Args:
         ctx_json (Mapping[str, Any]): Context mapping to hash.
 
     Returns:
-        str: SHA-256 hex digest over the canonical JSON serialization.
+        str: Hex digest (SHA-256 by default) over the canonical JSON serialization.
     """
-    return _sha256_hexdigest(json_dumps_canonical(dict(ctx_json)))
+    return _hash_mapping(ctx_json)
 
 
 def hash_state(agent_state: Mapping[str, Any]) -> str:
     """
-    Hash an agent state mapping using canonical JSON and SHA-256 policy.
+    Hash an agent state mapping using the canonical JSON and hashing policy.
 
     Args:
         agent_state (Mapping[str, Any]): Agent state mapping to hash.
 
     Returns:
-        str: SHA-256 hex digest over the canonical JSON serialization.
+        str: Hex digest (SHA-256 by default) over the canonical JSON serialization.
 
     Examples:
         >>> from crv.core.hashing import hash_state
         >>> hash_state({"a": 1}) == hash_state({"a": 1})
         True
     """
-    return _sha256_hexdigest(json_dumps_canonical(dict(agent_state)))
+    return _hash_mapping(agent_state)
@@ -5,7 +5,8 @@ enforce cross-field combination rules (notably for identity_edges).
 
 Responsibilities
 - Define the canonical Pydantic models for payloads, decisions, context/persona/affect, and rows.
-- Normalize enum-like strings to lower_snake via grammar helpers.
+- Normalize enum-like strings to lower_snake via grammar helpers; exact-match enum fields
+  (GraphEdit.operation, edge_kind, action_type) are Literal-typed and checked by pydantic-core.
 - Enforce cross-field combination rules and value ranges (e.g., IdentityEdgeRow).
 - Provide docstrings with Table mappings and, where applicable, Math mapping examples.
 
@@ -23,16 +24,17 @@ References
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Iterable, Mapping
+from typing import Any, Literal, get_args
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from .errors import GrammarError, SchemaError
 from .grammar import (
-    action_kind_from_value,
-    edge_kind_from_value,
+    ActionKind,
+    PatchOp,
+    RepresentationEdgeKind,
     exchange_kind_from_value,
-    is_lower_snake,
     normalize_visibility,
 )
 from .typing import JsonDict
@@ -86,7 +88,7 @@ class Utterance(BaseModel):
         >>> Utterance(act="say", topic="token_alpha", stance=None)
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
     act: str
     topic: str
@@ -114,7 +116,7 @@ class Interpretation(BaseModel):
         >>> Interpretation(event_type="endorsement", targets=["agent_j"], salience=0.7)
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
     event_type: str
     targets: list[str] = Field(default_factory=list)
@@ -140,7 +142,7 @@ class AppraisalVector(BaseModel):
         pydantic.ValidationError: If any component is outside [0, 1].
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
     valence: float = Field(..., ge=0.0, le=1.0)
     arousal: float = Field(..., ge=0.0, le=1.0)
@@ -149,12 +151,62 @@ class AppraisalVector(BaseModel):
     goal_congruence: float = Field(..., ge=0.0, le=1.0)
 
 
-_ALLOWED_GRAPH_OPS: set[str] = {
+# Canonical value sets as Literal types: pydantic-core checks membership natively, with
+# no Python validator callback per field. Spelled out for type checkers; each is kept in
+# sync with its crv.core.grammar enum by the import-time check below.
+_GraphOperation = Literal[
     "set_identity_edge_weight",
     "adjust_identity_edge_weight",
     "decay_identity_edges",
     "remove_identity_edge",
-}
+]
+_EdgeKindValue = Literal[
+    "self_to_positive_valence",
+    "self_to_negative_valence",
+    "self_to_object",
+    "self_to_agent",
+    "agent_to_positive_valence",
+    "agent_to_negative_valence",
+    "agent_to_object",
+    "agent_to_agent",
+    "agent_pair_to_object",
+    "object_to_positive_valence",
+    "object_to_negative_valence",
+    "object_to_object",
+]
+_ActionTypeValue = Literal[
+    "acquire_token",
+    "relinquish_token",
+    "relate_agent",
+    "relate_other_agents",
+    "endorse_token",
+    "coendorse_token_with_agents",
+    "expose_signal_about_token",
+    "declare_cooccurrence_between_tokens",
+    "propose_peer_exchange",
+    "accept_peer_exchange",
+    "reject_peer_exchange",
+    "settle_peer_exchange",
+    "post_order_to_venue",
+    "cancel_order_at_venue",
+    "settle_trade_from_venue",
+    "swap_at_venue",
+    "cast_vote_at_venue",
+    "publish_vote_outcome_from_venue",
+    "gift_token",
+    "send_chat_message",
+    "publish_announcement",
+]
+
+if __debug__:
+    for _alias, _enum in (
+        (_GraphOperation, PatchOp),
+        (_EdgeKindValue, RepresentationEdgeKind),
+        (_ActionTypeValue, ActionKind),
+    ):
+        if set(get_args(_alias)) != {m.value for m in _enum}:
+            raise ValueError(f"schema Literal out of sync with {_enum.__name__}")
+    del _alias, _enum
 
 
 class GraphEdit(BaseModel):
@@ -175,8 +227,8 @@ class GraphEdit(BaseModel):
         decay_lambda (float | None): Decay factor in [0, 1].
 
     Raises:
-        crv.core.errors.GrammarError: If operation or edge_kind is invalid or not lower_snake.
-        pydantic.ValidationError: If decay_lambda is outside [0, 1].
+        pydantic.ValidationError: If operation or edge_kind is not a canonical value, or
+            decay_lambda is outside [0, 1].
 
     Examples:
         - Token–token association:
@@ -196,10 +248,10 @@ class GraphEdit(BaseModel):
            "new_weight": 0.80}
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
-    operation: str
-    edge_kind: str
+    operation: _GraphOperation
+    edge_kind: _EdgeKindValue
     subject_id: str | None = None
     object_id: str | None = None
     related_agent_id: str | None = None
@@ -209,50 +261,6 @@ class GraphEdit(BaseModel):
     scope_selector: str | None = None
     decay_lambda: float | None = Field(default=None, ge=0.0, le=1.0)
 
-    @field_validator("operation", mode="before")
-    @classmethod
-    def _check_operation(cls, v: Any) -> str:
-        """
-        Validate that GraphEdit.operation is lower_snake and canonical.
-
-        Args:
-            v (Any): Proposed operation string.
-
-        Returns:
-            str: Canonical lower_snake operation string.
-
-        Raises:
-            GrammarError: If not lower_snake or not in the allowed set.
-        """
-        s = v or ""
-        if not is_lower_snake(s):
-            raise GrammarError(f"graph operation must be lower_snake, got {v!r}")
-        if s not in _ALLOWED_GRAPH_OPS:
-            raise GrammarError(f"unknown graph operation {v!r}")
-        return s
-
-    @field_validator("edge_kind", mode="before")
-    @classmethod
-    def _normalize_edge_kind(cls, v: Any) -> Any:
-        """
-        Normalize edge_kind using grammar.edge_kind_from_value.
-
-        Args:
-            v (Any): Proposed edge_kind string.
-
-        Returns:
-            Any: Canonical lower_snake edge_kind string, or None.
-
-        Raises:
-            GrammarError: If not lower_snake or unknown edge kind.
-        """
-        if v is None:
-            return v
-        try:
-            return edge_kind_from_value(str(v)).value
-        except Exception as e:  # ValueError from grammar
-            raise GrammarError(str(e)) from e
-
 
 class RepresentationPatch(BaseModel):
     """
@@ -283,11 +291,35 @@ class RepresentationPatch(BaseModel):
         2
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     edits: list[GraphEdit] = Field(default_factory=list)
     energy_delta: float | None = None
 
+    @classmethod
+    def from_raw_edits(
+        cls, edits: Iterable[Mapping[str, Any]], energy_delta: float | None = None
+    ) -> RepresentationPatch:
+        """
+        Build a patch from raw edit mappings in one validation pass.
+
+        Args:
+            edits (Iterable[Mapping[str, Any]]): Raw GraphEdit payloads (e.g., parsed JSON).
+            energy_delta (float | None): Optional BIT energy diagnostic.
+
+        Returns:
+            RepresentationPatch: Validated patch.
+
+        Raises:
+            pydantic.ValidationError: If any edit is invalid.
+
+        Notes:
+            Prefer this over RepresentationPatch(edits=[GraphEdit(**d) for d in raws]):
+            pydantic-core validates the whole list natively instead of one Python
+            constructor call per edit.
+        """
+        return cls.model_validate({"edits": list(edits), "energy_delta": energy_delta})
+
 
 # ============================================================================
 # Decisions
@@ -305,7 +337,7 @@ class ActionCandidate(BaseModel):
         key (str): Compact, human-friendly label; program logic MUST NOT parse this.
 
     Raises:
-        crv.core.errors.GrammarError: If action_type is not lower_snake or not a known ActionKind.
+        pydantic.ValidationError: If action_type is not a known ActionKind value.
 
     Examples:
         >>> from crv.core.schema import ActionCandidate
@@ -319,35 +351,13 @@ class ActionCandidate(BaseModel):
         'acquire_token'
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
-    action_type: str
+    action_type: _ActionTypeValue
     parameters: dict[str, Any] = Field(default_factory=dict)
     score: float
     key: str
 
-    @field_validator("action_type", mode="before")
-    @classmethod
-    def _normalize_action_type(cls, v: Any) -> Any:
-        """
-        Normalize action_type via grammar.action_kind_from_value.
-
-        Args:
-            v (Any): Proposed action_type value.
-
-        Returns:
-            str: Canonical lower_snake action_type string (e.g., 'acquire_token').
-
-        Raises:
-            GrammarError: If not lower_snake or unknown ActionKind.
-        """
-        if v is None:
-            return v
-        try:
-            return action_kind_from_value(str(v)).value
-        except Exception as e:
-            raise GrammarError(str(e)) from e
-
 
 class DecisionHead(BaseModel):
     """
@@ -367,7 +377,7 @@ class DecisionHead(BaseModel):
         >>> DecisionHead(action_candidates=[ActionCandidate(action_type="acquire_token", parameters={}, score=0.2, key="k")])
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     token_value_estimates: dict[str, float] = Field(default_factory=dict)
     action_candidates: list[ActionCandidate] = Field(default_factory=list)
@@ -404,7 +414,7 @@ class ScenarioContext(BaseModel):
         exchange_snapshot.baseline_value corresponds to B_token(t) when emitted by a venue.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     token_id: str | None = None
     owner_status: str | None = None
@@ -450,7 +460,7 @@ class Persona(BaseModel):
         traits (dict[str, Any]): Free-form trait mapping used by downstream modules.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     persona_id: str
     label: str
@@ -467,7 +477,7 @@ class AffectState(BaseModel):
         stress (float): In [0, 1]. Defaults to 0.0.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
     valence: float = Field(0.5, ge=0.0, le=1.0)
     arousal: float = Field(0.5, ge=0.0, le=1.0)
@@ -744,11 +754,11 @@ class IdentityEdgeRow(BaseModel):
         edge_sign (int | None): Optional sign encoding (0/1 or -1/1).
 
     Raises:
-        crv.core.errors.GrammarError: On invalid edge_kind.
+        pydantic.ValidationError: If edge_kind is not a canonical RepresentationEdgeKind value.
         crv.core.errors.SchemaError: When required field combinations are not met.
 
     Notes:
-        - edge_kind is normalized via grammar.edge_kind_from_value.
+        - edge_kind is checked natively by pydantic-core against the canonical values.
         - Required field combinations are enforced via model_validator (see tests).
 
         Math mapping:
@@ -770,7 +780,7 @@ class IdentityEdgeRow(BaseModel):
 
     tick: int
     observer_agent_id: str
-    edge_kind: str
+    edge_kind: _EdgeKindValue
 
     # slots
     subject_id: str | None = None
@@ -782,28 +792,6 @@ class IdentityEdgeRow(BaseModel):
     edge_weight: float
     edge_sign: int | None = None
 
-    @field_validator("edge_kind", mode="before")
-    @classmethod
-    def _normalize_edge_kind_row(cls, v: Any) -> Any:
-        """
-        Normalize IdentityEdgeRow.edge_kind via grammar.edge_kind_from_value.
-
-        Args:
-            v (Any): Proposed edge_kind.
-
-        Returns:
-            Any: Canonical lower_snake edge_kind, or None.
-
-        Raises:
-            GrammarError: If not lower_snake or unknown edge kind.
-        """
-        if v is None:
-            return v
-        try:
-            return edge_kind_from_value(str(v)).value
-        except Exception as e:
-            raise GrammarError(str(e)) from e
-
     @model_validator(mode="after")
     def _validate_combination(self) -> IdentityEdgeRow:
         """
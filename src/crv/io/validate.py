@@ -19,6 +19,8 @@ Checks performed (Phase 1)
   - Scalar types ("i64","f64","str") are safely cast when possible.
   - "struct" accepts pl.Struct or pl.Object (no deep validation).
   - "list[struct]" accepts pl.List (inner type not enforced yet).
+- Grammar enum columns (edge_kind, exchange_event_type, visibility_scope) hold only
+  canonical enum values; checked once per column over its unique values.
 
 Notes
 - File protocol baseline only; this module depends on polars and crv.core descriptors.
@@ -30,7 +32,7 @@ from collections.abc import Iterable
 
 import polars as pl
 
-from crv.core.grammar import TableName
+from crv.core.grammar import ExchangeKind, RepresentationEdgeKind, TableName, Visibility
 from crv.core.tables import TableDescriptor, get_table
 
 from .errors import IoSchemaError
@@ -45,6 +47,15 @@ _DTYPE_MAP: dict[str, object] = {
 }
 
 
+# Columns that carry serialized grammar enums. Validated column-at-a-time (unique values
+# against the allowed set) instead of per-row *_kind_from_value calls.
+_ENUM_COLUMNS: dict[str, list[str]] = {
+    "edge_kind": [m.value for m in RepresentationEdgeKind],
+    "exchange_event_type": [m.value for m in ExchangeKind],
+    "visibility_scope": [m.value for m in Visibility],
+}
+
+
 def _is_struct_like(dtype: pl.DataType) -> bool:
     # Accept both Struct and Object for early-phase flexibility.
     return isinstance(dtype, pl.Struct) or dtype == pl.Object
@@ -79,6 +90,16 @@ def _ensure_columns_present(df: pl.DataFrame, needed: Iterable[str]) -> None:
         raise IoSchemaError(f"missing required columns: {missing!r}")
 
 
+def _ensure_enum_values(df: pl.DataFrame, col: str, allowed: list[str]) -> None:
+    values = df.get_column(col).drop_nulls().unique()
+    bad = values.filter(~values.is_in(allowed))
+    if bad.len():
+        raise IoSchemaError(
+            f"column {col!r} has non-canonical values {sorted(bad.to_list())[:5]!r} "
+            f"(allowed={allowed!r})"
+        )
+
+
 def _ensure_no_extra_columns(df: pl.DataFrame, allowed: set[str]) -> None:
     extras = [c for c in df.columns if c not in allowed]
     if extras:
@@ -103,12 +124,13 @@ def validate_frame_against_descriptor(
         pl.DataFrame: Possibly with safe casts applied for scalar types.
 
     Raises:
-        IoSchemaError: If required columns are missing, extras are present under strict mode, or dtypes are incompatible and cannot be safely cast.
+        IoSchemaError: If required columns are missing, extras are present under strict mode, dtypes are incompatible and cannot be safely cast, or an enum column holds non-canonical values.
 
     Notes:
         - Scalar columns ("i64","f64","str"): attempt non-strict casts.
         - Struct-like columns accept pl.Struct or pl.Object.
         - List[struct] accepts any pl.List inner type in Phase 1.
+        - Enum columns are checked as a whole (unique values vs. allowed set).
     """
     # Ensure presence and no extras (strict)
     required = set(desc.required)
@@ -139,6 +161,8 @@ def validate_frame_against_descriptor(
                 raise IoSchemaError(f"column {col!r} expected list-like dtype; got {actual}")
         else:  # pragma: no cover - defensive
             raise IoSchemaError(f"unknown descriptor dtype {dtype_name!r} for column {col!r}")
+        if col in _ENUM_COLUMNS:
+            _ensure_enum_values(df, col, _ENUM_COLUMNS[col])
 
     return df
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import polars as pl
 
-from app.charts import apply_ts_sampling, extract_identity_representation
+from app.charts import apply_ts_sampling, extract_identity_representation, ts_sampling_plan
 
 
 def test_extract_identity_representation_slices_and_filters() -> None:
@@ -63,6 +63,9 @@ def test_extract_identity_representation_slices_and_filters() -> None:
     )
 
     # Assert objects contain only top 2 by |s_io| (o=2,3)
+    # Both slices are ranked by magnitude, largest first
+    assert [row["o"] for row in out["objects"]] == [2, 3]
+    assert [row["j"] for row in out["others"]] == [6, 5]
     objs = {(row["o"], row["s_io"]) for row in out["objects"]}
     assert {2, 3} == {o for (o, _) in objs}
     # Assert others contain top 2 by |a_ij| (j=6 and j=5), with weights preserved
@@ -86,3 +89,33 @@ def test_apply_ts_sampling_stride_and_max_points() -> None:
     # Max points enforces a cap (<= requested)
     df_cap = apply_ts_sampling(df, max_points=7)
     assert 1 <= df_cap.height <= 7
+
+
+def test_apply_ts_sampling_lttb_keeps_spikes_per_series() -> None:
+    # Two flat series of 500 points each; only series "a" has a single spike
+    values = [0.0] * 1000
+    values[237] = 10.0
+    df = pl.DataFrame({"t": list(range(500)) * 2, "v": values, "c": ["a"] * 500 + ["b"] * 500})
+    out = apply_ts_sampling(df, max_points=50, y_col="v", by=["c"])
+    assert out.height <= 50
+    # Budget is shared evenly across series and the spike survives downsampling
+    assert out.filter(pl.col("c") == "a").height == out.filter(pl.col("c") == "b").height
+    assert out.get_column("v").max() == 10.0
+    # Explicit stride still wins over LTTB
+    assert apply_ts_sampling(df, stride=10, y_col="v").height == 100
+
+
+def test_sampling_without_cap_passes_frames_without_t_unchanged() -> None:
+    df = pl.DataFrame({"step": [2, 0, 1], "x": [1.0, 2.0, 3.0]})
+    assert apply_ts_sampling(df).equals(df)
+    assert ts_sampling_plan(df).collect().equals(df)
+    assert ts_sampling_plan(df, max_points=10, stride=1).collect().equals(df)
+
+
+def test_extract_identity_representation_accepts_step_keyed_relations() -> None:
+    at_df = pl.DataFrame({"t": [0], "agent_id": [0], "o": [1], "s_io": [0.5]})
+    rel_df = pl.DataFrame({"step": [0, 0], "i": [0, 0], "j": [5, 6], "a_ij": [0.3, -0.8]})
+    out = extract_identity_representation(
+        at_df=at_df, rel_df=rel_df, other_df=None, oo_df=None, agent_sel=0, t_sel=0
+    )
+    assert {row["j"] for row in out["others"]} == {5, 6}
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from app.data import (
+    load_agents_tokens,
+    load_cee,
+    load_relation_tables,
+    load_relations,
+    load_relations_at_t,
+    run_file_stamp,
+)
+
+
+def _write_relations(p: Path, a_ij: list[float]) -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    n = len(a_ij)
+    df = pl.DataFrame({"step": list(range(n)), "i": [0] * n, "j": [1] * n, "a_ij": a_ij})
+    df.write_parquet(p)
+
+
+def test_load_relations_cache_invalidates_when_file_changes(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    _write_relations(run_dir / "relations.parquet", [0.5])
+
+    first = load_relations(str(run_dir))
+    assert first is not None and first.height == 1
+
+    # Rewriting the parquet changes its (mtime_ns, size) stamp, so the cache must miss
+    _write_relations(run_dir / "relations.parquet", [0.5, -0.25, 0.75])
+    second = load_relations(str(run_dir))
+    assert second is not None and second.height == 3
+    assert second.get_column("t").to_list() == [0, 1, 2]
+
+
+def test_load_relations_at_t_returns_only_selected_slice(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    _write_relations(run_dir / "relations.parquet", [0.5, -0.25, 0.75])
+
+    at_t = load_relations_at_t(str(run_dir), 1)
+    assert at_t is not None
+    assert at_t.columns == ["t", "i", "j", "a_ij"]
+    assert at_t.get_column("t").to_list() == [1]
+    assert at_t.get_column("a_ij").to_list() == [-0.25]
+
+    assert load_relations_at_t(str(tmp_path / "missing"), 1) is None
+
+
+def test_run_file_stamp_tracks_rewrites(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    assert run_file_stamp(str(run_dir), "relations.parquet") is None
+    _write_relations(run_dir / "relations.parquet", [0.5])
+    first = run_file_stamp(str(run_dir), "relations.parquet")
+    _write_relations(run_dir / "relations.parquet", [0.5, -0.25, 0.75])
+    assert first is not None and run_file_stamp(str(run_dir), "relations.parquet") != first
+
+
+def test_load_cee_pushes_window_and_group_filters(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    df = pl.DataFrame(
+        {
+            "t": [0, 1, 2, 0, 1, 2],
+            "token_id": [0, 0, 0, 1, 1, 1],
+            "group": ["a", "a", "a", "b", "b", "b"],
+            "cee": [0.1, 0.2, 0.3, -0.1, -0.2, -0.3],
+        }
+    )
+    df.write_parquet(run_dir / "cee.parquet")
+
+    full = load_cee(str(run_dir))
+    assert full is not None
+    assert full.columns == ["t", "o", "group", "cee"] and full.height == 6
+
+    sub = load_cee(str(run_dir), t_range=(1, 2), groups=("b",))
+    assert sub is not None
+    assert sub.get_column("cee").to_list() == [-0.2, -0.3]
+
+    assert load_cee(str(tmp_path / "missing")) is None
+
+
+def test_load_cee_raises_on_unexpected_schema(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    # A present file without t (step is not accepted for CEE) is a schema error, not "missing"
+    pl.DataFrame({"step": [0], "o": [0], "cee": [0.1]}).write_parquet(run_dir / "cee.parquet")
+    with pytest.raises(ValueError, match="missing required columns"):
+        load_cee(str(run_dir))
+
+
+def test_load_agents_tokens_encodes_group_as_categorical(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    df = pl.DataFrame(
+        {"step": [0, 0, 1], "agent_id": [0, 1, 0], "token_id": [0, 0, 0], "group": ["b", "a", "b"]}
+    )
+    df.write_parquet(run_dir / "agents_tokens.parquet")
+
+    at_df = load_agents_tokens(str(run_dir))
+    assert at_df.schema["group"] == pl.Categorical
+    assert at_df.get_column("group").unique().sort().to_list() == ["a", "b"]
+
+
+def test_load_relation_tables_collects_present_tables(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    _write_relations(run_dir / "relations.parquet", [0.5, -0.25])
+    df = pl.DataFrame({"step": [0], "i": [0], "j": [1], "o": [2], "b_ijo": [0.3]})
+    df.write_parquet(run_dir / "other_object.parquet")
+
+    rel, other, oo = load_relation_tables(str(run_dir))
+    assert rel is not None and rel.columns == ["t", "i", "j", "a_ij"] and rel.height == 2
+    assert other is not None and other.columns == ["t", "i", "j", "o", "b_ijo"]
+    assert oo is None
+
+
+def test_load_relation_tables_pushes_t_and_agent_filters(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    df = pl.DataFrame({"step": [0, 1, 1], "i": [0, 0, 1], "j": [1, 1, 0], "a_ij": [0.1, 0.2, 0.3]})
+    df.write_parquet(run_dir / "relations.parquet")
+
+    rel, _, _ = load_relation_tables(str(run_dir), t_sel=1)
+    assert rel is not None and rel.get_column("a_ij").to_list() == [0.2, 0.3]
+    rel, _, _ = load_relation_tables(str(run_dir), t_sel=1, agent=1)
+    assert rel is not None and rel.get_column("a_ij").to_list() == [0.3]
+
+
+def test_loaders_restore_sorted_flag_on_t(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    _write_relations(run_dir / "relations.parquet", [0.5, -0.25, 0.75])
+
+    rel = load_relations(str(run_dir))
+    assert rel is not None and rel.get_column("t").flags["SORTED_ASC"]
@@ -4,7 +4,13 @@ import time
 
 import polars as pl
 
-from app.ui.helpers import compute_overview_kpis, format_ts, humanize_ago
+from app.ui.helpers import (
+    compute_overview_kpis,
+    compute_overview_summary,
+    format_ts,
+    humanize_ago,
+    unique_sorted,
+)
 
 
 def test_humanize_ago_and_format_ts_smoke() -> None:
@@ -26,6 +32,8 @@ def test_compute_overview_kpis_uses_final_t_and_aggregates_mean_and_hold_rate()
     # Final t = 1; mean(value_score) = (0.30 + 0.50)/2 = 0.40; hold rate = mean([1,0]) = 0.5
     assert abs(kpi["final_mean_value"] - 0.40) < 1e-9
     assert abs(kpi["final_hold_rate"] - 0.50) < 1e-9
+    # A LazyFrame (e.g. straight from scan_parquet) yields the same KPIs
+    assert compute_overview_kpis(df.lazy()) == kpi
 
 
 def test_compute_overview_kpis_handles_missing_columns_gracefully() -> None:
@@ -33,3 +41,17 @@ def test_compute_overview_kpis_handles_missing_columns_gracefully() -> None:
     df = pl.DataFrame({"t": [0, 1], "agent_id": [0, 0]})
     kpi = compute_overview_kpis(df)
     assert kpi == {"final_mean_value": 0.0, "final_hold_rate": 0.0}
+
+
+def test_unique_sorted_drops_nulls_and_handles_missing_column() -> None:
+    df = pl.DataFrame({"i": [3, None, 1, 3, 2]})
+    assert unique_sorted(df, "i") == [1, 2, 3]
+    assert unique_sorted(df, "missing") == []
+
+
+def test_compute_overview_summary_returns_kpis_and_counts_by_t() -> None:
+    df = pl.DataFrame({"t": [1, 0, 1], "value_score": [0.30, 0.10, 0.50], "y_io": [1, 0, 0]})
+    kpi, counts = compute_overview_summary(df)
+    assert kpi == compute_overview_kpis(df)
+    assert abs(kpi["final_mean_value"] - 0.40) < 1e-9
+    assert counts.rows() == [(0, 1), (1, 2)]
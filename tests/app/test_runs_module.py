@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import os
+import shutil
 from pathlib import Path
 
 import polars as pl
 import pytest
 
-from app.ui.runs import cached_list_runs, create_min_demo_run, list_runs_impl
+import app.ui.runs as runs_module
+from app.ui.runs import (
+    cached_list_runs,
+    create_min_demo_run,
+    list_recent_runs_under,
+    list_runs_disk_cached,
+    list_runs_impl,
+)
 
 
 def _write_min_agents_tokens(p: Path) -> None:
@@ -81,7 +90,8 @@ def test_list_runs_impl_accepts_runs_with_model_or_manifest(
     assert str(run_dir.resolve()) in paths
 
 
-def test_cached_list_runs_matches_uncached(tmp_path: Path) -> None:
+def test_cached_list_runs_matches_uncached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(runs_module, "DISCOVERY_CACHE_DIR", tmp_path / "cache")
     # Prepare two runs to exercise ordering and caching
     r1 = tmp_path / "r1"
     r2 = tmp_path / "r2"
@@ -98,3 +108,85 @@ def test_cached_list_runs_matches_uncached(tmp_path: Path) -> None:
     assert u_paths == c_paths, (
         "cached_list_runs should reflect list_runs_impl results for same roots"
     )
+
+
+def test_list_recent_runs_under_prunes_ignored_dirs(tmp_path: Path) -> None:
+    visible = tmp_path / "runs" / "visible"
+    hidden = tmp_path / "node_modules" / "pkg" / "hidden"
+    for run in (visible, hidden):
+        _write_min_agents_tokens(run / "agents_tokens.parquet")
+        (run / "metadata.json").write_text("{}", encoding="utf-8")
+
+    found = {p.resolve() for p in list_recent_runs_under(tmp_path)}
+    assert found == {visible.resolve()}
+
+
+def test_list_runs_disk_cached_reuses_entry_until_tree_changes(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    cache_dir = tmp_path / "cache"
+    r1 = root / "r1"
+    _write_min_agents_tokens(r1 / "agents_tokens.parquet")
+    _write_min_model_parquet(r1 / "model.parquet")
+
+    first = list_runs_disk_cached((str(root),), 200, cache_dir=cache_dir)
+    assert [r["name"] for r in first] == ["r1"]
+    assert len(list(cache_dir.glob("runs_*.json"))) == 1
+    assert list_runs_disk_cached((str(root),), 200, cache_dir=cache_dir) == first
+
+    # A new run directory changes the root mtime, which re-keys the cache
+    r2 = root / "r2"
+    _write_min_agents_tokens(r2 / "agents_tokens.parquet")
+    _write_min_model_parquet(r2 / "model.parquet")
+    second = list_runs_disk_cached((str(root),), 200, cache_dir=cache_dir)
+    assert {r["name"] for r in second} == {"r1", "r2"}
+
+
+def test_cached_list_runs_sees_new_run_without_ttl(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(runs_module, "DISCOVERY_CACHE_DIR", tmp_path / "cache")
+    root = tmp_path / "root"
+    _write_min_agents_tokens(root / "r1" / "agents_tokens.parquet")
+    _write_min_model_parquet(root / "r1" / "model.parquet")
+    assert [r["name"] for r in cached_list_runs((str(root),), 200)] == ["r1"]
+
+    # The key tracks root mtimes, so a freshly created run is visible on the next call
+    _write_min_agents_tokens(root / "r2" / "agents_tokens.parquet")
+    _write_min_model_parquet(root / "r2" / "model.parquet")
+    assert {r["name"] for r in cached_list_runs((str(root),), 200)} == {"r1", "r2"}
+
+
+def test_list_runs_disk_cached_sees_files_written_after_mkdir(tmp_path: Path) -> None:
+    # <root>/runs/<run_id>/ layout: the run directory exists before its files do
+    root = tmp_path / "out"
+    run = root / "runs" / "r1"
+    run.mkdir(parents=True)
+    os.utime(run, ns=(0, 0))
+    cache_dir = tmp_path / "cache"
+    assert list_runs_disk_cached((str(root),), 200, cache_dir=cache_dir) == []
+
+    # Writing the files touches only the run directory's mtime, which the key tracks
+    _write_min_agents_tokens(run / "agents_tokens.parquet")
+    (run / "metadata.json").write_text("{}", encoding="utf-8")
+    found = list_runs_disk_cached((str(root),), 200, cache_dir=cache_dir)
+    assert [r["path"] for r in found] == [str(run.resolve())]
+
+
+def test_list_runs_disk_cached_drops_deleted_and_rewritten_runs(tmp_path: Path) -> None:
+    # Runs sit three levels down, below what _discovery_key stamps
+    root = tmp_path / "root"
+    parent = root / "a" / "b"
+    cache_dir = tmp_path / "cache"
+    r1, r2 = parent / "r1", parent / "r2"
+    for run in (r1, r2):
+        _write_min_agents_tokens(run / "agents_tokens.parquet")
+        _write_min_model_parquet(run / "model.parquet")
+    assert len(list_runs_disk_cached((str(root),), 200, cache_dir=cache_dir)) == 2
+
+    # Pin the parent mtime so the key is unchanged and only hit validation can notice
+    parent_stat = parent.stat()
+    shutil.rmtree(r2)
+    os.utime(r1, ns=(0, 10**9))
+    os.utime(parent, ns=(parent_stat.st_atime_ns, parent_stat.st_mtime_ns))
+    found = list_runs_disk_cached((str(root),), 200, cache_dir=cache_dir)
+    assert [(r["name"], r["mtime"]) for r in found] == [("r1", 1.0)]
@@ -1,4 +1,7 @@
+import pytest
+
 from crv.core.grammar import (
+    _LOWER_SNAKE_RE,
     ActionKind,
     ChannelType,
     ExchangeKind,
@@ -6,7 +9,12 @@ from crv.core.grammar import (
     RepresentationEdgeKind,
     TableName,
     Visibility,
+    action_kind_from_value,
+    canonical_action_key,
+    edge_kind_from_value,
     ensure_all_enum_values_lower_snake,
+    exchange_kind_from_value,
+    is_lower_snake,
 )
 
 
@@ -22,3 +30,31 @@ def test_all_enum_values_are_lower_snake() -> None:
             TableName,
         ]
     )
+
+
+def test_kind_from_value_round_trips_and_rejects_bad_input() -> None:
+    for enum_cls, parse in (
+        (ActionKind, action_kind_from_value),
+        (ExchangeKind, exchange_kind_from_value),
+        (RepresentationEdgeKind, edge_kind_from_value),
+    ):
+        for member in enum_cls:
+            assert parse(member.value) is member
+        with pytest.raises(ValueError, match="lower_snake"):
+            parse("Not-Snake")
+        with pytest.raises(ValueError):
+            parse("unknown_kind_value")
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["acquire_token", "a1_b2", "123", "x", "", "_a", "a_", "a__b", "Acquire", "a-b", "é", "a\n"],
+)
+def test_is_lower_snake_matches_reference_pattern(value: str) -> None:
+    assert is_lower_snake(value) == bool(_LOWER_SNAKE_RE.fullmatch(value))
+
+
+def test_canonical_action_key_sorts_params_and_pipes_separators() -> None:
+    assert canonical_action_key(ActionKind.ACQUIRE_TOKEN) == "acquire_token"
+    key = canonical_action_key(ActionKind.ACQUIRE_TOKEN, token_id="Alpha", qty=2, note="a, b")
+    assert key == "acquire_token:note=a|b|qty=2|token_id=Alpha"
@@ -1,4 +1,8 @@
-from crv.core.hashing import hash_row, json_dumps_canonical
+import hashlib
+
+import pytest
+
+from crv.core.hashing import _hash_uncached, _resolve_hasher, hash_row, json_dumps_canonical
 from crv.core.serde import json_dumps_canonical as serde_dumps
 from crv.core.serde import json_loads
 
@@ -26,3 +30,27 @@ def test_serde_roundtrip_and_reexport() -> None:
     s = serde_dumps(obj)
     back = json_loads(s)
     assert back == obj
+
+
+def test_hash_row_cached_path_matches_uncached_and_keeps_types_apart() -> None:
+    rows = [{"a": 1}, {"a": True}, {"a": 1.0}, {"a": 0.0}, {"a": -0.0}, {"a": None}, {"a": "1"}]
+    for row in rows:
+        assert hash_row(row) == _hash_uncached(row)
+        assert hash_row(dict(row)) == _hash_uncached(row)  # warm cache hit
+    assert len({hash_row(row) for row in rows}) == len(rows)
+
+
+def test_resolve_hasher_supports_blake2b_and_rejects_unknown() -> None:
+    data = b'{"a":1}'
+    assert _resolve_hasher("sha256")(data).hexdigest() == hashlib.sha256(data).hexdigest()
+    blake = _resolve_hasher(" BLAKE2b ")(data).hexdigest()
+    assert blake == hashlib.blake2b(data, digest_size=32).hexdigest() and len(blake) == 64
+    with pytest.raises(ValueError):
+        _resolve_hasher("md5")
+
+
+def test_streamed_hash_equals_one_shot_canonical_digest() -> None:
+    state = {"z": {"b": [1, 2.5, None], "a": "🙂"}, "a": [{"y": True}, "x"], "m": {}}
+    expected = hashlib.sha256(json_dumps_canonical(state).encode("utf-8")).hexdigest()
+    assert _hash_uncached(state) == expected
+    assert _hash_uncached({}) == hashlib.sha256(b"{}").hexdigest()
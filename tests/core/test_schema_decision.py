@@ -1,7 +1,9 @@
+from typing import Any
+
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
-from crv.core.schema import ActionCandidate, DecisionHead
+from crv.core.schema import ActionCandidate, DecisionHead, Persona, ScenarioContext, Utterance
 
 
 def test_action_candidate_normalizes_action_type() -> None:
@@ -23,3 +25,32 @@ def test_decision_head_defaults() -> None:
     assert dh.action_candidates == []
     assert dh.abstain is False
     assert dh.temperature == 0.0
+
+
+@pytest.mark.parametrize(
+    "model,data",
+    [
+        (Utterance, {"act": "say", "topic": "t", "claims": None}),
+        (Utterance, {"act": "say", "topic": "t", "claims": "oops"}),
+        (Utterance, {"act": "say", "topic": "t", "style": [1]}),
+        (
+            ActionCandidate,
+            {"action_type": "acquire_token", "parameters": [], "score": 0.1, "key": "k"},
+        ),
+        (ScenarioContext, {"salient_agent_pairs": [1, 2]}),
+        (Persona, {"persona_id": "p", "label": "l", "traits": [1, 2]}),
+    ],
+)
+def test_free_form_containers_validated_by_default(
+    model: type[BaseModel], data: dict[str, Any]
+) -> None:
+    with pytest.raises(ValidationError):
+        model.model_validate(data)
+
+
+def test_free_form_containers_are_copied_on_construction() -> None:
+    params = {"token_id": "t"}
+    ac = ActionCandidate(action_type="acquire_token", parameters=params, score=0.5, key="k")
+    # Later caller mutation must not leak into the frozen model
+    params["token_id"] = "u"
+    assert ac.parameters == {"token_id": "t"}
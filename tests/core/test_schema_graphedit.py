@@ -1,7 +1,12 @@
+from enum import Enum
+from typing import Any, get_args
+
 import pytest
 from pydantic import ValidationError
 
-from crv.core.schema import GraphEdit
+from crv.core import schema
+from crv.core.grammar import ActionKind, PatchOp, RepresentationEdgeKind
+from crv.core.schema import GraphEdit, RepresentationPatch
 
 
 def test_graphedit_accepts_canonical_ops_token_token() -> None:
@@ -112,3 +117,40 @@ def test_graphedit_accepts_self_anchor_positive() -> None:
     assert ge.operation == "set_identity_edge_weight"
     assert ge.edge_kind == "self_to_positive_valence"
     assert ge.new_weight == 0.8
+
+
+def test_representation_patch_from_raw_edits_validates_batch() -> None:
+    raws = [
+        {
+            "operation": "set_identity_edge_weight",
+            "edge_kind": "object_to_object",
+            "new_weight": 0.5,
+        },
+        {"operation": "decay_identity_edges", "edge_kind": "self_to_object", "decay_lambda": 0.9},
+    ]
+    patch = RepresentationPatch.from_raw_edits(raws, energy_delta=-0.1)
+    assert [e.operation for e in patch.edits] == [
+        "set_identity_edge_weight",
+        "decay_identity_edges",
+    ]
+    assert patch.energy_delta == -0.1
+    with pytest.raises(ValidationError):
+        RepresentationPatch.from_raw_edits([{**raws[0], "edge_kind": "bogus"}])
+
+
+def test_graphedit_is_frozen() -> None:
+    ge = GraphEdit(operation="remove_identity_edge", edge_kind="object_to_object")
+    with pytest.raises(ValidationError):
+        ge.edge_kind = "self_to_object"  # type: ignore[misc]
+
+
+@pytest.mark.parametrize(
+    "alias,enum",
+    [
+        (schema._GraphOperation, PatchOp),
+        (schema._EdgeKindValue, RepresentationEdgeKind),
+        (schema._ActionTypeValue, ActionKind),
+    ],
+)
+def test_schema_literals_match_grammar_enums(alias: Any, enum: type[Enum]) -> None:
+    assert set(get_args(alias)) == {member.value for member in enum}
@@ -1,6 +1,7 @@
 import pytest
 from pydantic import ValidationError
 
+from crv.core.grammar import Visibility
 from crv.core.schema import MessageRow, ScenarioRow
 
 
@@ -25,6 +26,8 @@ def test_scenario_row_visibility_normalization() -> None:
         context_hash="abc",
     )
     assert row.visibility_scope == "group"
+    # Normalized tokens are the enum's own value object, not a fresh string per row
+    assert row.visibility_scope is Visibility.GROUP.value
 
 
 def test_visibility_invalid_raises() -> None:
@@ -29,6 +29,22 @@ def test_required_missing_column_raises(tmp_path: Path):
         ds.append(TableName.IDENTITY_EDGES, df)
 
 
+def test_non_canonical_enum_values_raise(tmp_path: Path):
+    settings = IoSettings(root_dir=str(tmp_path))
+    ds = Dataset(settings, run_id=RunId("run_bad_enum"))
+
+    df = pl.DataFrame(
+        {
+            "tick": [0, 1, 2],
+            "observer_agent_id": ["A0", "A1", "A2"],
+            "edge_kind": ["self_to_object", "Self_To_Object", "not_an_edge"],
+            "edge_weight": [0.1, 0.2, 0.3],
+        }
+    )
+    with pytest.raises(IoSchemaError, match="not_an_edge"):
+        ds.append(TableName.IDENTITY_EDGES, df)
+
+
 def test_scalar_casting_for_required_types(tmp_path: Path):
     settings = IoSettings(root_dir=str(tmp_path))
     ds = Dataset(settings, run_id=RunId("run_cast_scalars"))